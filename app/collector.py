@@ -1,25 +1,33 @@
 """MySQL diagnostic data collector using PyMySQL."""
 
-import json
+import io
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, List, Union
+from typing import Optional, Dict, Any, Tuple, List, Union, Iterator
 import time
 import re
+import queue
+import threading
+import orjson
 import pymysql
 from pymysql import OperationalError, Error
+from pymysql.constants import CLIENT
 
 from .utils import (
+    MAX_PARALLEL_HOSTS,
+    MAX_CONCURRENT_JOBS,
     HostConfig,
     get_host_by_id,
+    load_hosts_by_id,
     ensure_output_dir,
     get_job_dir,
+    invalidate_job_status,
 )
 from .parser import (
-    parse_innodb_status, 
+    format_innodb_status, 
     parse_global_status, 
     parse_processlist, 
     parse_config_variables, 
@@ -29,13 +37,16 @@ from .parser import (
     analyze_innodb_health,
     CONFIG_VARIABLES_ALLOWLIST
 )
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
 from .db import get_db_context
 from .models import Job, JobHost, JobStatus, HostJobStatus
 
 logger = logging.getLogger("masc.collector")
 
 
-# Commands to execute - run in parallel for speed
+# Commands to execute - sent to each host as one multi-statement batch
 COMMANDS = [
     "SHOW ENGINE INNODB STATUS",
     "SHOW GLOBAL STATUS",
@@ -45,6 +56,27 @@ COMMANDS = [
     "SHOW MASTER STATUS",   # For master binlog position (to compare with replicas)
 ]
 
+# Commands that return a single row (or nothing)
+_SINGLE_ROW_COMMANDS = (
+    "SHOW REPLICA STATUS",
+    "SHOW SLAVE STATUS",
+    "SHOW MASTER STATUS",
+    "SHOW BINARY LOG STATUS",
+)
+
+# Shared worker pool for host collection - reused across jobs, never shut down
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_PARALLEL_HOSTS, thread_name_prefix="masc")
+
+# Whole jobs run on their own small pool so a job waiting on its hosts never occupies
+# a host worker; jobs beyond MAX_CONCURRENT_JOBS wait (status pending) for a free slot
+_JOB_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS, thread_name_prefix="masc-job")
+
+# Idle connections kept per (host, port, user, password, timeout) between collections.
+# Host edits call drain_pools(), so sessions opened for an old config are not reused.
+_POOL_SIZE = min(len(COMMANDS), 4)
+_POOLS: Dict[Tuple[str, int, str, str, int], "queue.Queue[pymysql.Connection]"] = {}
+_POOLS_LOCK = threading.Lock()
+
 
 def _timestamp() -> str:
     """Get current timestamp string."""
@@ -55,12 +87,34 @@ def _update_progress(progress_file: Optional[Path], progress: Dict[str, Any]) ->
     """Write progress to file for real-time status updates."""
     if progress_file:
         try:
-            with open(progress_file, "w") as f:
-                json.dump(progress, f)
+            with open(progress_file, "wb") as f:
+                f.write(orjson.dumps(progress))
         except Exception:
             pass  # Non-critical, don't fail collection
 
 
+def _json_bytes(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes for an output file."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def _write_files(output_dir: Path, files: Dict[str, bytes]) -> None:
+    """
+    Write several pre-serialized output files in one pass.
+    
+    Uses unbuffered os.open/os.write, so each file costs one open, one write and one
+    close. Nothing is fsync'd (same as the plain open()/close() it replaces).
+    """
+    for name, data in files.items():
+        fd = os.open(output_dir / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
 def _create_mysql_connection(host: HostConfig, timeout: int = 120) -> pymysql.Connection:
     """
     Create a PyMySQL connection to the host.
@@ -83,11 +137,91 @@ def _create_mysql_connection(host: HostConfig, timeout: int = 120) -> pymysql.Co
         connect_timeout=timeout,
         read_timeout=timeout,
         write_timeout=timeout,
-        cursorclass=pymysql.cursors.DictCursor
+        cursorclass=pymysql.cursors.DictCursor,
+        client_flag=CLIENT.MULTI_STATEMENTS
     )
 
 
-def _format_result_as_text(command: str, result: Union[List[Dict[str, Any]], Dict[str, Any], str], duration: float, cmd_start: str, cmd_end: str) -> str:
+def _pool_key(host: HostConfig, timeout: int) -> Tuple[str, int, str, str, int]:
+    """Pool key: everything a pooled session was opened with, including its timeouts."""
+    return (host.host, host.port, host.user, host.password, timeout)
+
+
+def _get_pool(host: HostConfig, timeout: int) -> "queue.Queue[pymysql.Connection]":
+    """Get (or lazily create) the idle-connection pool for a host and timeout."""
+    key = _pool_key(host, timeout)
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.setdefault(key, queue.Queue(maxsize=_POOL_SIZE))
+    return pool
+
+
+def _checkout_connection(host: HostConfig, timeout: int = 120) -> pymysql.Connection:
+    """
+    Take an idle pooled connection for the host, or open a new one.
+    
+    Connections are pooled per timeout, so a reused session always has the
+    connect/read/write timeouts asked for. Pooled connections are pinged first;
+    dead ones (e.g. killed by wait_timeout) are dropped.
+    
+    Raises:
+        OperationalError: If a new connection is needed and connecting fails
+    """
+    pool = _get_pool(host, timeout)
+    while True:
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            conn.ping(reconnect=False)
+            return conn
+        except Exception:
+            _close_quietly(conn)
+    return _create_mysql_connection(host, timeout=timeout)
+
+
+def _release_connection(host: HostConfig, conn: pymysql.Connection, timeout: int = 120) -> None:
+    """
+    Return a connection to the pool it was checked out from (same timeout), closing
+    it if broken, the pool is full, or the pool was drained while it was checked out.
+    """
+    if not conn.open:
+        return
+    pool = _POOLS.get(_pool_key(host, timeout))
+    if pool is None:
+        _close_quietly(conn)
+        return
+    try:
+        pool.put_nowait(conn)
+    except queue.Full:
+        _close_quietly(conn)
+
+
+def drain_pools() -> None:
+    """Close all idle pooled connections (call after hosts are edited, toggled or deleted)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            _close_quietly(conn)
+
+
+def _close_quietly(conn: pymysql.Connection) -> None:
+    """Close a connection, ignoring errors from an already-dead socket."""
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _format_result_as_text(command: str, result: Union[List[Dict[str, Any]], Dict[str, Any], str], duration: float) -> str:
     """
     Format PyMySQL result as text output (for backward compatibility with raw.txt).
     
@@ -95,38 +229,37 @@ def _format_result_as_text(command: str, result: Union[List[Dict[str, Any]], Dic
         command: The SQL command executed
         result: The result from PyMySQL (list of dicts, single dict, or string)
         duration: Execution duration in seconds
-        cmd_start: Start timestamp
-        cmd_end: End timestamp
     
     Returns:
         Formatted text output matching CLI format
     """
-    output = f"\n{'='*60}\n"
-    output += f"-- {command}\n"
-    output += f"-- Time: {cmd_start} -> {cmd_end} ({duration:.2f}s)\n"
-    output += f"{'='*60}\n"
+    output = io.StringIO()
+    output.write(f"\n{'='*60}\n")
+    output.write(f"-- {command}\n")
+    output.write(f"-- Duration: {duration:.2f}s\n")
+    output.write(f"{'='*60}\n")
     
     if isinstance(result, str):
         # For SHOW ENGINE INNODB STATUS, result is the Status column text
-        output += result
+        output.write(result)
     elif isinstance(result, dict):
         # Single row result (e.g., SHOW REPLICA STATUS, SHOW MASTER STATUS)
         if result:
             # Format as tab-separated header and row
             headers = list(result.keys())
             values = [str(result.get(h, '')) for h in headers]
-            output += "\t".join(headers) + "\n"
-            output += "\t".join(values) + "\n"
+            output.write("\t".join(headers) + "\n")
+            output.write("\t".join(values) + "\n")
     elif isinstance(result, list):
         # Multiple rows (e.g., SHOW GLOBAL STATUS, SHOW PROCESSLIST)
         if result:
             headers = list(result[0].keys())
-            output += "\t".join(headers) + "\n"
+            output.write("\t".join(headers) + "\n")
             for row in result:
                 values = [str(row.get(h, '')) for h in headers]
-                output += "\t".join(values) + "\n"
+                output.write("\t".join(values) + "\n")
     
-    return output
+    return output.getvalue()
 
 
 
@@ -184,12 +317,43 @@ def _parse_version_tuple(version_str: str) -> Tuple[int, int, int]:
         return (0, 0, 0)
 
 
+def _fetch_result(cursor, command: str) -> Union[List[Dict[str, Any]], Dict[str, Any], str]:
+    """
+    Read the current result set from the cursor, shaped for the given command.
+    
+    Returns:
+        str for InnoDB status and SELECT VERSION(), dict for single-row status
+        commands, list of dicts for everything else
+    """
+    cmd_upper = command.upper()
+    if cmd_upper.startswith("SHOW ENGINE INNODB STATUS"):
+        # SHOW ENGINE INNODB STATUS returns Type, Name, Status columns
+        # We want the Status column value (the InnoDB monitor text)
+        row = cursor.fetchone()
+        if row and "Status" in row:
+            return row["Status"]
+        return ""
+    elif cmd_upper.startswith(_SINGLE_ROW_COMMANDS):
+        # These return a single row or empty
+        row = cursor.fetchone()
+        return row if row else {}
+    elif cmd_upper.startswith("SELECT VERSION()"):
+        # SELECT VERSION() returns a single row with VERSION() column
+        row = cursor.fetchone()
+        if row:
+            return row.get("VERSION()", "")
+        return ""
+    else:
+        # Other SHOW commands return multiple rows
+        return cursor.fetchall()
+
+
 def _run_single_command(
     host: HostConfig, 
     command: str
 ) -> Tuple[str, bool, Union[List[Dict[str, Any]], Dict[str, Any], str], str, float]:
     """
-    Run a single MySQL command using PyMySQL.
+    Run a single MySQL command on a pooled PyMySQL connection.
     
     Returns:
         Tuple of (command, success, structured_result, formatted_text, duration_seconds)
@@ -197,83 +361,130 @@ def _run_single_command(
         formatted_text: Text formatted output for backward compatibility
     """
     host_label = f"{host.label} ({host.host}:{host.port})"
-    start_time = time.time()
-    cmd_start = _timestamp()
+    start_time = time.monotonic()
     
     try:
-        conn = _create_mysql_connection(host, timeout=120)
-        logger.info(f"[DB CONNECT] {host_label} | {command}")
+        conn = _checkout_connection(host, timeout=120)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[DB CONNECT] {host_label} | {command}")
         
         try:
             with conn.cursor() as cursor:
                 cursor.execute(command)
-                
-                # Handle different command types
-                if command.upper().startswith("SHOW ENGINE INNODB STATUS"):
-                    # SHOW ENGINE INNODB STATUS returns Type, Name, Status columns
-                    # We want the Status column value (the InnoDB monitor text)
-                    row = cursor.fetchone()
-                    if row and "Status" in row:
-                        result = row["Status"]
-                    else:
-                        result = ""
-                elif command.upper().startswith("SHOW REPLICA STATUS") or \
-                     command.upper().startswith("SHOW SLAVE STATUS") or \
-                     command.upper().startswith("SHOW MASTER STATUS") or \
-                     command.upper().startswith("SHOW BINARY LOG STATUS"):
-                    # These return a single row or empty
-                    row = cursor.fetchone()
-                    result = row if row else {}
-                elif command.upper().startswith("SELECT VERSION()"):
-                    # SELECT VERSION() returns a single row with VERSION() column
-                    row = cursor.fetchone()
-                    if row:
-                        result = row.get("VERSION()", "")
-                    else:
-                        result = ""
-                else:
-                    # Other SHOW commands return multiple rows
-                    result = cursor.fetchall()
+                result = _fetch_result(cursor, command)
             
-            duration = time.time() - start_time
-            cmd_end = _timestamp()
-            logger.info(f"[DB DISCONNECT] OK ({duration:.2f}s) | {host_label} | {command}")
+            duration = time.monotonic() - start_time
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[DB DISCONNECT] OK ({duration:.2f}s) | {host_label} | {command}")
             
             # Format result as text for backward compatibility
-            formatted_text = _format_result_as_text(command, result, duration, cmd_start, cmd_end)
+            formatted_text = _format_result_as_text(command, result, duration)
             
             return (command, True, result, formatted_text, duration)
             
         except Error as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             error_msg = str(e)
             logger.warning(f"[DB DISCONNECT] ERROR ({duration:.2f}s) | {host_label} | {command}: {error_msg}")
-            formatted_text = _format_result_as_text(command, "", duration, cmd_start, _timestamp())
+            formatted_text = _format_result_as_text(command, "", duration)
             return (command, False, error_msg, formatted_text, duration)
         finally:
-            conn.close()
+            _release_connection(host, conn)
             
     except OperationalError as e:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         error_msg = str(e)
         logger.warning(f"[DB CONNECT] FAILED ({duration:.2f}s) | {host_label} | {command}: {error_msg}")
-        formatted_text = _format_result_as_text(command, "", duration, cmd_start, _timestamp())
+        formatted_text = _format_result_as_text(command, "", duration)
         return (command, False, error_msg, formatted_text, duration)
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         error_msg = str(e)
         logger.exception(f"[DB] EXCEPTION ({duration:.2f}s) | {host_label} | {command}: {error_msg}")
-        formatted_text = _format_result_as_text(command, "", duration, cmd_start, _timestamp())
+        formatted_text = _format_result_as_text(command, "", duration)
         return (command, False, error_msg, formatted_text, duration)
 
 
+def _run_command_batch(
+    host: HostConfig,
+    commands: List[str]
+) -> Iterator[Tuple[str, bool, Union[List[Dict[str, Any]], Dict[str, Any], str], str, float]]:
+    """
+    Run all commands as one multi-statement batch on a single pooled connection.
+    
+    Result sets are read in order with cursor.nextset(); each command's duration is
+    the time spent waiting for its result set. MySQL stops executing a batch at the
+    first failing statement, so any commands after a failure are retried one by one.
+    
+    Yields:
+        (command, success, structured_result, formatted_text, duration_seconds) as each
+        result set is read, in the same order as commands
+    """
+    host_label = f"{host.label} ({host.host}:{host.port})"
+    start_time = time.monotonic()
+    
+    try:
+        conn = _checkout_connection(host, timeout=120)
+    except Exception as e:
+        duration = time.monotonic() - start_time
+        error_msg = str(e)
+        logger.warning(f"[DB CONNECT] FAILED ({duration:.2f}s) | {host_label} | batch: {error_msg}")
+        for command in commands:
+            formatted_text = _format_result_as_text(command, "", duration)
+            yield (command, False, error_msg, formatted_text, duration)
+        return
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[DB CONNECT] {host_label} | batch of {len(commands)} commands")
+    batch_start = start_time
+    index = 0
+    lost_error = None
+    try:
+        with conn.cursor() as cursor:
+            try:
+                cursor.execute(";\n".join(commands))
+                while index < len(commands):
+                    command = commands[index]
+                    result = _fetch_result(cursor, command)
+                    duration = time.monotonic() - start_time
+                    formatted_text = _format_result_as_text(command, result, duration)
+                    index += 1
+                    yield (command, True, result, formatted_text, duration)
+                    start_time = time.monotonic()
+                    if index < len(commands) and not cursor.nextset():
+                        break
+            except Exception as e:
+                duration = time.monotonic() - start_time
+                error_msg = str(e)
+                logger.warning(f"[DB] ERROR ({duration:.2f}s) | {host_label} | {commands[index]}: {error_msg}")
+                formatted_text = _format_result_as_text(commands[index], "", duration)
+                index += 1
+                if not conn.open:
+                    lost_error = error_msg
+                yield (commands[index - 1], False, error_msg, formatted_text, duration)
+    finally:
+        _release_connection(host, conn)
+    
+    # Statements after a failure were never executed by the server. Retry them one
+    # by one - unless the connection itself died, in which case fail them without
+    # paying a reconnect timeout per command.
+    for command in commands[index:]:
+        if lost_error:
+            yield (command, False, lost_error, _format_result_as_text(command, "", 0.0), 0.0)
+        else:
+            yield _run_single_command(host, command)
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[DB DISCONNECT] OK ({time.monotonic() - batch_start:.2f}s) | {host_label} | batch of {len(commands)} commands")
+
+
 def run_mysql_commands_parallel(
     host: HostConfig, 
     progress_file: Optional[Path] = None,
     known_version: Optional[str] = None
 ) -> Tuple[bool, str, Dict[str, Any], Dict[str, Union[List[Dict[str, Any]], Dict[str, Any], str]]]:
     """
-    Run MySQL diagnostic commands in PARALLEL using PyMySQL.
+    Run MySQL diagnostic commands using PyMySQL (one batched round-trip per host).
     
     Args:
         host: Host configuration
@@ -286,9 +497,9 @@ def run_mysql_commands_parallel(
     """
     host_label = f"{host.label} ({host.host}:{host.port})"
     collection_start = _timestamp()
-    overall_start = time.time()
+    overall_start = time.monotonic()
     
-    logger.info(f"[PARALLEL] Starting collection for {host_label}")
+    logger.info(f"[BATCH] Starting collection for {host_label}")
     
     # Get MySQL Version first to determine correct commands (or use known version)
     if known_version:
@@ -328,7 +539,7 @@ def run_mysql_commands_parallel(
     
     logger.info(f"[{host.label}] Selected commands: {current_commands}")
     
-    # Run all commands in parallel
+    # Run all commands
     results = {}  # command -> (success, structured_result, formatted_text, duration)
     structured_results = {}  # command -> structured_result
     timing = {
@@ -346,86 +557,77 @@ def run_mysql_commands_parallel(
     }
     _update_progress(progress_file, progress)
     
-    with ThreadPoolExecutor(max_workers=len(current_commands)) as executor:
-        # Submit all commands
-        futures = {
-            executor.submit(_run_single_command, host, cmd): cmd 
-            for cmd in current_commands
+    def _record(cmd_name, success, structured_result, formatted_text, duration):
+        results[cmd_name] = (success, formatted_text)
+        structured_results[cmd_name] = structured_result
+        timing["commands"][cmd_name] = {
+            "duration": round(duration, 3),
+            "success": success
         }
-        
-        # Collect results as they complete
-        for future in as_completed(futures):
-            command = futures[future]
-            try:
-                cmd_name, success, structured_result, formatted_text, duration = future.result()
-                results[cmd_name] = (success, formatted_text)
-                structured_results[cmd_name] = structured_result
-                timing["commands"][cmd_name] = {
-                    "duration": round(duration, 3),
-                    "success": success
-                }
-                # Update progress
-                progress["completed_commands"] += 1
-                progress["commands"][cmd_name] = {
-                    "status": "completed" if success else "failed",
-                    "duration": round(duration, 3)
-                }
-                _update_progress(progress_file, progress)
-            except Exception as e:
-                logger.exception(f"[PARALLEL] Exception for {command}: {e}")
-                error_msg = str(e)
-                results[command] = (False, error_msg)
-                structured_results[command] = error_msg
-                timing["commands"][command] = {
-                    "duration": 0,
-                    "success": False,
-                    "error": error_msg
-                }
-                progress["completed_commands"] += 1
-                progress["commands"][command] = {"status": "failed", "error": error_msg}
-                _update_progress(progress_file, progress)
-    
-    overall_duration = time.time() - overall_start
-    timing["completed_at"] = _timestamp()
+        # Update progress
+        progress["completed_commands"] += 1
+        progress["commands"][cmd_name] = {
+            "status": "completed" if success else "failed",
+            "duration": round(duration, 3)
+        }
+        _update_progress(progress_file, progress)
+    
+    # One pooled connection, all statements pipelined in a single round-trip
+    for cmd_result in _run_command_batch(host, current_commands):
+        _record(*cmd_result)
+    
+    overall_duration = time.monotonic() - overall_start
+    collection_end = _timestamp()
+    timing["completed_at"] = collection_end
     timing["total_duration"] = round(overall_duration, 3)
     
     # Check if any command failed
     all_success = all(success for success, _ in results.values())
     
+    # Nothing succeeded (usually unreachable host or bad credentials) - return a short
+    # error summary instead of formatting empty banners for every command
+    if not any(success for success, _ in results.values()):
+        first_error = next(
+            (r for r in structured_results.values() if isinstance(r, str) and r), "no commands were run"
+        )
+        logger.warning(f"[BATCH] All commands failed for {host_label} in {overall_duration:.2f}s: {first_error}")
+        return False, f"[{collection_end}] MySQL error on {host.host}:{host.port}: {first_error}", timing, structured_results
+    
     # Build combined output in command order (for raw.txt backward compatibility)
-    all_output = []
-    all_output.append(f"{'#'*60}")
-    all_output.append(f"# MySQL Diagnostic Collection (PARALLEL)")
-    all_output.append(f"# Host: {host.host}:{host.port}")
-    all_output.append(f"# User: {host.user}")
-    all_output.append(f"# Started: {collection_start}")
-    all_output.append(f"# Mode: Parallel ({len(current_commands)} concurrent connections)")
-    all_output.append(f"# Server Version: {version_str}")
-    all_output.append(f"{'#'*60}")
+    buf = io.StringIO()
+    buf.write(f"{'#'*60}\n")
+    buf.write(f"# MySQL Diagnostic Collection (BATCHED)\n")
+    buf.write(f"# Host: {host.host}:{host.port}\n")
+    buf.write(f"# User: {host.user}\n")
+    buf.write(f"# Started: {collection_start}\n")
+    buf.write(f"# Mode: Batched ({len(current_commands)} statements, 1 pooled connection)\n")
+    buf.write(f"# Server Version: {version_str}\n")
+    buf.write(f"{'#'*60}\n")
     
     for command in current_commands:
         if command in results:
             success, formatted_text = results[command]
             if success:
-                all_output.append(formatted_text)
+                buf.write(formatted_text)
+                buf.write("\n")
             else:
-                all_output.append(f"\n{'='*60}")
-                all_output.append(f"-- {command}")
-                all_output.append(f"-- ERROR: {formatted_text}")
-                all_output.append(f"{'='*60}")
+                buf.write(f"\n{'='*60}\n")
+                buf.write(f"-- {command}\n")
+                buf.write(f"-- ERROR: {formatted_text}\n")
+                buf.write(f"{'='*60}\n")
     
-    all_output.append(f"\n{'#'*60}")
-    all_output.append(f"# Collection completed: {_timestamp()}")
-    all_output.append(f"# Total time: {overall_duration:.2f}s (parallel)")
-    all_output.append(f"{'#'*60}")
+    buf.write(f"\n{'#'*60}\n")
+    buf.write(f"# Collection completed: {collection_end}\n")
+    buf.write(f"# Total time: {overall_duration:.2f}s (batched)\n")
+    buf.write(f"{'#'*60}\n")
     
     if all_success:
-        logger.info(f"[PARALLEL] Completed {host_label} in {overall_duration:.2f}s")
+        logger.info(f"[BATCH] Completed {host_label} in {overall_duration:.2f}s")
     else:
         failed = [cmd for cmd, (s, _) in results.items() if not s]
-        logger.warning(f"[PARALLEL] Completed {host_label} with errors in {overall_duration:.2f}s - Failed: {failed}")
+        logger.warning(f"[BATCH] Completed {host_label} with errors in {overall_duration:.2f}s - Failed: {failed}")
     
-    return all_success, "\n".join(all_output), timing, structured_results
+    return all_success, buf.getvalue(), timing, structured_results
 
 
 # Keep the old sequential function for fallback
@@ -439,14 +641,14 @@ def run_mysql_command(host: HostConfig) -> tuple[bool, str]:
     Returns:
         Tuple of (success, output/error)
     """
-    all_output = []
+    buf = io.StringIO()
     collection_start = _timestamp()
-    all_output.append(f"{'#'*60}")
-    all_output.append(f"# MySQL Diagnostic Collection")
-    all_output.append(f"# Host: {host.host}:{host.port}")
-    all_output.append(f"# User: {host.user}")
-    all_output.append(f"# Started: {collection_start}")
-    all_output.append(f"{'#'*60}")
+    buf.write(f"{'#'*60}\n")
+    buf.write(f"# MySQL Diagnostic Collection\n")
+    buf.write(f"# Host: {host.host}:{host.port}\n")
+    buf.write(f"# User: {host.user}\n")
+    buf.write(f"# Started: {collection_start}\n")
+    buf.write(f"{'#'*60}\n")
     
     host_label = f"{host.label} ({host.host}:{host.port})"
     
@@ -454,35 +656,71 @@ def run_mysql_command(host: HostConfig) -> tuple[bool, str]:
         cmd_name, success, _, formatted_text, _ = _run_single_command(host, command)
         if not success:
             return False, f"[{_timestamp()}] MySQL error: {formatted_text}"
-        all_output.append(formatted_text)
+        buf.write(formatted_text)
+        buf.write("\n")
     
-    all_output.append(f"\n{'#'*60}")
-    all_output.append(f"# Collection completed: {_timestamp()}")
-    all_output.append(f"{'#'*60}")
+    buf.write(f"\n{'#'*60}\n")
+    buf.write(f"# Collection completed: {_timestamp()}\n")
+    buf.write(f"{'#'*60}\n")
     
-    return True, "\n".join(all_output)
+    return True, buf.getvalue()
 
 
-def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = False) -> bool:
+def collect_host_data(
+    job_id: str,
+    host_id: str,
+    collect_hot_tables: bool = False,
+    job_host_id: Optional[str] = None,
+    host: Optional[HostConfig] = None
+) -> bool:
     """
-    Collect diagnostic data from a single host using PARALLEL command execution.
+    Collect diagnostic data from a single host using one batched connection.
     
     Args:
         job_id: Job identifier
         host_id: Host identifier
         collect_hot_tables: Whether to query performance_schema for hot tables
+        job_host_id: Primary key of the JobHost row (looked up if not given)
+        host: Already-resolved host configuration (looked up if not given)
     
     Returns:
         True if successful, False otherwise
     """
+    if job_host_id is None:
+        job_host_id = _get_job_host_id(job_id, host_id)
+    
+    error = _collect_host_data(job_id, host_id, collect_hot_tables, job_host_id, host)
+    if error is None:
+        _update_host_status(job_host_id, HostJobStatus.completed)
+    else:
+        _update_host_status(job_host_id, HostJobStatus.failed, error)
+    return error is None
+
+
+def _collect_host_data(
+    job_id: str,
+    host_id: str,
+    collect_hot_tables: bool,
+    job_host_id: Optional[str],
+    host: Optional[HostConfig]
+) -> Optional[str]:
+    """
+    Collect data for one host, recording only the running transition.
+    
+    The terminal JobHost status is left to the caller so run_collection_job
+    can write it through the job's own session.
+    
+    Returns:
+        None if successful, otherwise the error message for the host
+    """
     # Get host configuration
-    host = get_host_by_id(host_id)
+    if host is None:
+        host = get_host_by_id(host_id)
     if not host:
         logger.error(f"[{job_id[:8]}] Host {host_id} not found in configuration")
-        _update_host_status(job_id, host_id, HostJobStatus.failed, f"Host {host_id} not found")
-        return False
+        return f"Host {host_id} not found"
     
-    logger.info(f"[{job_id[:8]}] Starting PARALLEL collection for {host.label} ({host.host}:{host.port})")
+    logger.info(f"[{job_id[:8]}] Starting collection for {host.label} ({host.host}:{host.port})")
     
     # Fetch MySQL version early to update status
     try:
@@ -493,48 +731,44 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
 
     # Update status to running with version info
     if version_str:
-         _update_host_status(job_id, host_id, HostJobStatus.running, mysql_version=version_str)
+         _update_host_status(job_host_id, HostJobStatus.running, mysql_version=version_str)
     else:
-         _update_host_status(job_id, host_id, HostJobStatus.running)
+         _update_host_status(job_host_id, HostJobStatus.running)
     
     # Ensure output directory exists FIRST (for progress file)
     output_dir = ensure_output_dir(job_id, host_id)
     progress_file = output_dir / "progress.json"
     
     # Track total collection time (including parsing and hot tables)
-    total_start_time = datetime.now()
+    total_start_time = time.monotonic()
     
-    # Run MySQL commands in PARALLEL (with real-time progress)
-    start_time = datetime.now()
+    # Run MySQL commands as one batch (with real-time progress)
+    start_time = time.monotonic()
     success, output, timing, structured_results = run_mysql_commands_parallel(host, progress_file, known_version=version_str)
-    commands_elapsed = (datetime.now() - start_time).total_seconds()
+    commands_elapsed = time.monotonic() - start_time
     logger.info(f"[{job_id[:8]}] MySQL commands for {host.label} completed in {commands_elapsed:.1f}s")
     
     # Normalize output - convert literal \n to actual newlines (MySQL escapes them in InnoDB status)
     if '\\n' in output:
         output = output.replace('\\n', '\n')
     
-    # Always save raw output (for backward compatibility)
-    raw_file = output_dir / "raw.txt"
-    with open(raw_file, "w") as f:
-        f.write(output)
-    
-    # Save timing metrics
-    timing_file = output_dir / "timing.json"
-    with open(timing_file, "w") as f:
-        json.dump(timing, f, indent=2)
+    # Always save raw output (for backward compatibility) and timing metrics -
+    # except timing for a hard failure, where there is nothing worth timing
+    files = {"raw.txt": output.encode("utf-8")}
+    if success or len(output) >= 1024:
+        files["timing.json"] = _json_bytes(timing)
+    _write_files(output_dir, files)
     
     if not success:
-        total_elapsed = (datetime.now() - total_start_time).total_seconds()
+        total_elapsed = time.monotonic() - total_start_time
         logger.error(f"[{job_id[:8]}] Collection FAILED for {host.label} after {total_elapsed:.1f}s: {output[:100]}")
         _update_progress(progress_file, {"phase": "failed", "error": output[:200]})
-        _update_host_status(job_id, host_id, HostJobStatus.failed, output)
-        return False
+        return output
     
     try:
         # Update progress to parsing phase
         _update_progress(progress_file, {"phase": "parsing", "message": "Processing collected data..."})
-        parse_start = datetime.now()
+        parse_start = time.monotonic()
         
         # Get InnoDB status text (for parsers that need it)
         innodb_status_text = ""
@@ -542,12 +776,12 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
             innodb_result = structured_results["SHOW ENGINE INNODB STATUS"]
             if isinstance(innodb_result, str):
                 innodb_status_text = innodb_result
+        if '\\n' in innodb_status_text:
+            innodb_status_text = innodb_status_text.replace('\\n', '\n')
         
-        # Parse and save InnoDB status (still needs text input)
-        innodb_content = parse_innodb_status(output) if innodb_status_text else "InnoDB status not available"
-        innodb_file = output_dir / "innodb.txt"
-        with open(innodb_file, "w") as f:
-            f.write(innodb_content)
+        # Format and save InnoDB status (from its own result, not the combined raw output)
+        innodb_content = format_innodb_status(innodb_status_text) if innodb_status_text else "InnoDB status not available"
+        artifacts = {"innodb.txt": innodb_content.encode("utf-8")}
         
         # Parse and save Global Status (using structured data)
         global_status_result = structured_results.get("SHOW GLOBAL STATUS", [])
@@ -555,9 +789,7 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
             global_status = parse_global_status(global_status_result)
         else:
             global_status = {}
-        global_status_file = output_dir / "global_status.json"
-        with open(global_status_file, "w") as f:
-            json.dump(global_status, f, indent=2)
+        artifacts["global_status.json"] = _json_bytes(global_status)
         logger.debug(f"[{job_id[:8]}] Parsed {len(global_status)} global status variables")
         
         # Parse and save Processlist (using structured data)
@@ -566,9 +798,7 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
             processlist = parse_processlist(processlist_result)
         else:
             processlist = []
-        processlist_file = output_dir / "processlist.json"
-        with open(processlist_file, "w") as f:
-            json.dump(processlist, f, indent=2)
+        artifacts["processlist.json"] = _json_bytes(processlist)
         logger.debug(f"[{job_id[:8]}] Parsed {len(processlist)} processes")
         
         # Parse and save Config Variables (using structured data)
@@ -577,16 +807,12 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
             config_vars_all = parse_config_variables(config_vars_result, filter_allowlist=False)
         else:
             config_vars_all = {}
-        config_vars_file = output_dir / "config_vars.json"
-        with open(config_vars_file, "w") as f:
-            json.dump(config_vars_all, f, indent=2)
+        artifacts["config_vars.json"] = _json_bytes(config_vars_all)
         logger.debug(f"[{job_id[:8]}] Parsed {len(config_vars_all)} config variables")
         
         # Calculate and save Buffer Pool metrics (derived from global_status + config_vars)
         buffer_pool = calculate_buffer_pool_metrics(global_status, config_vars_all)
-        buffer_pool_file = output_dir / "buffer_pool.json"
-        with open(buffer_pool_file, "w") as f:
-            json.dump(buffer_pool, f, indent=2)
+        artifacts["buffer_pool.json"] = _json_bytes(buffer_pool)
         if buffer_pool.get("pool_size_gb"):
             logger.debug(f"[{job_id[:8]}] Buffer pool: {buffer_pool['pool_size_gb']}GB, hit ratio: {buffer_pool.get('hit_ratio')}%")
         
@@ -596,9 +822,7 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
             replica_status = parse_replica_status(replica_result)
         else:
             replica_status = {"is_replica": False}
-        replica_status_file = output_dir / "replica_status.json"
-        with open(replica_status_file, "w") as f:
-            json.dump(replica_status, f, indent=2)
+        artifacts["replica_status.json"] = _json_bytes(replica_status)
         if replica_status.get("is_replica"):
             lag = replica_status.get("seconds_behind_master")
             lag_str = f"{lag}s" if lag is not None else "NULL"
@@ -612,20 +836,15 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
             master_status = parse_master_status(master_result)
         else:
             master_status = {"is_master": False}
-        master_status_file = output_dir / "master_status.json"
-        with open(master_status_file, "w") as f:
-            json.dump(master_status, f, indent=2)
+        artifacts["master_status.json"] = _json_bytes(master_status)
         if master_status.get("is_master"):
             logger.info(f"[{job_id[:8]}] Master binlog for {host.label}: {master_status.get('file')}:{master_status.get('position')}")
         else:
             logger.debug(f"[{job_id[:8]}] {host.label} has no master status (binlog disabled or not primary)")
         
         # Analyze InnoDB Health (deadlocks, lock contention, hot indexes, semaphores, redo log)
-        # Still needs text output for parsing InnoDB monitor sections
-        innodb_health = analyze_innodb_health(output)
-        innodb_health_file = output_dir / "innodb_health.json"
-        with open(innodb_health_file, "w") as f:
-            json.dump(innodb_health, f, indent=2)
+        innodb_health = analyze_innodb_health(innodb_status_text)
+        artifacts["innodb_health.json"] = _json_bytes(innodb_health)
         
         # Log any health issues found
         if innodb_health.get("summary", {}).get("has_issues"):
@@ -637,20 +856,21 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
         else:
             logger.debug(f"[{job_id[:8]}] {host.label} InnoDB health: No issues detected")
         
+        # Flush all parsed artifacts in one pass
+        _write_files(output_dir, artifacts)
+        
         # Log parsing time
-        parse_elapsed = (datetime.now() - parse_start).total_seconds()
+        parse_elapsed = time.monotonic() - parse_start
         logger.info(f"[{job_id[:8]}] Parsing completed for {host.label} in {parse_elapsed:.1f}s")
         
         # Collect Hot Tables (optional - queries performance_schema)
         if collect_hot_tables:
             _update_progress(progress_file, {"phase": "hot_tables", "message": "Querying performance_schema..."})
             logger.info(f"[{job_id[:8]}] Starting hot tables query for {host.label}...")
-            ht_start = datetime.now()
-            hot_tables = _collect_hot_tables(host, job_id)
-            ht_elapsed = (datetime.now() - ht_start).total_seconds()
-            hot_tables_file = output_dir / "hot_tables.json"
-            with open(hot_tables_file, "w") as f:
-                json.dump(hot_tables, f, indent=2)
+            ht_start = time.monotonic()
+            hot_tables = _collect_hot_tables(host, job_id, version_str)
+            ht_elapsed = time.monotonic() - ht_start
+            _write_files(output_dir, {"hot_tables.json": _json_bytes(hot_tables)})
             if hot_tables.get("tables"):
                 logger.info(f"[{job_id[:8]}] Hot tables for {host.label}: {len(hot_tables['tables'])} tables ({ht_elapsed:.1f}s)")
             elif hot_tables.get("error"):
@@ -659,26 +879,63 @@ def collect_host_data(job_id: str, host_id: str, collect_hot_tables: bool = Fals
                 logger.debug(f"[{job_id[:8]}] No hot tables data for {host.label} ({ht_elapsed:.1f}s)")
         
         # Update status to completed
-        total_elapsed = (datetime.now() - total_start_time).total_seconds()
+        total_elapsed = time.monotonic() - total_start_time
         _update_progress(progress_file, {"phase": "completed", "total_elapsed": round(total_elapsed, 1)})
-        _update_host_status(job_id, host_id, HostJobStatus.completed)
         logger.info(f"[{job_id[:8]}] Collection COMPLETED for {host.label} in {total_elapsed:.1f}s (commands: {commands_elapsed:.1f}s)")
-        return True
+        return None
         
     except Exception as e:
         logger.exception(f"[{job_id[:8]}] Parse error for {host.label}: {e}")
         _update_progress(progress_file, {"phase": "failed", "error": str(e)[:200]})
-        _update_host_status(job_id, host_id, HostJobStatus.failed, str(e))
-        return False
+        return str(e)
+
+
+# Hot tables is optional and must not hold up a collection: its connections use this
+# timeout (pooled apart from the batch's 120s ones) and the query carries the same
+# limit server-side where the server supports one
+_HOT_TABLES_TIMEOUT = 15
+
+_HOT_TABLES_QUERY = """
+        SELECT{hint}
+            OBJECT_SCHEMA AS `schema`,
+            OBJECT_NAME AS `table`,
+            SUM(COUNT_READ) AS read_ops,
+            SUM(COUNT_WRITE) AS write_ops,
+            SUM(COUNT_STAR) AS total_ops
+        FROM performance_schema.table_io_waits_summary_by_index_usage
+        WHERE OBJECT_SCHEMA NOT IN ('mysql', 'performance_schema', 'information_schema', 'sys')
+          AND OBJECT_NAME IS NOT NULL
+        GROUP BY OBJECT_SCHEMA, OBJECT_NAME
+        ORDER BY total_ops DESC
+        LIMIT 10
+    """
+
+
+def _hot_tables_query(version_str: Optional[str]) -> str:
+    """
+    The hot tables query with a server-side time limit for the server's flavour.
+    
+    MySQL 5.7.8+ honours a MAX_EXECUTION_TIME optimizer hint (milliseconds; older
+    MySQL reads it as a comment). MariaDB ignores the hint, so 10.1+ gets
+    SET STATEMENT max_statement_time (seconds) instead. Servers without either
+    rely on the connection's read timeout.
+    """
+    if version_str and "mariadb" in version_str.lower():
+        query = _HOT_TABLES_QUERY.format(hint="")
+        if _parse_version_tuple(version_str) >= (10, 1, 0):
+            return f"SET STATEMENT max_statement_time={_HOT_TABLES_TIMEOUT} FOR {query.strip()}"
+        return query
+    return _HOT_TABLES_QUERY.format(hint=f" /*+ MAX_EXECUTION_TIME({_HOT_TABLES_TIMEOUT * 1000}) */")
 
 
-def _collect_hot_tables(host: HostConfig, job_id: str) -> Dict[str, Any]:
+def _collect_hot_tables(host: HostConfig, job_id: str, version_str: Optional[str] = None) -> Dict[str, Any]:
     """
     Query performance_schema for hot tables (most active by I/O operations).
     
     Args:
         host: Host configuration
         job_id: Job ID for logging
+        version_str: Server version (selects the statement time limit syntax)
         
     Returns:
         Dictionary with tables list or empty if unavailable
@@ -690,24 +947,11 @@ def _collect_hot_tables(host: HostConfig, job_id: str) -> Dict[str, Any]:
     }
     
     # Query to get top 10 tables by total I/O operations
-    query = """
-        SELECT 
-            OBJECT_SCHEMA AS `schema`,
-            OBJECT_NAME AS `table`,
-            SUM(COUNT_READ) AS read_ops,
-            SUM(COUNT_WRITE) AS write_ops,
-            SUM(COUNT_STAR) AS total_ops
-        FROM performance_schema.table_io_waits_summary_by_index_usage
-        WHERE OBJECT_SCHEMA NOT IN ('mysql', 'performance_schema', 'information_schema', 'sys')
-          AND OBJECT_NAME IS NOT NULL
-        GROUP BY OBJECT_SCHEMA, OBJECT_NAME
-        ORDER BY total_ops DESC
-        LIMIT 10
-    """
+    query = _hot_tables_query(version_str)
     
     try:
-        start_time = time.time()
-        conn = _create_mysql_connection(host, timeout=15)
+        start_time = time.monotonic()
+        conn = _checkout_connection(host, timeout=_HOT_TABLES_TIMEOUT)
         
         try:
             with conn.cursor() as cursor:
@@ -724,10 +968,10 @@ def _collect_hot_tables(host: HostConfig, job_id: str) -> Dict[str, Any]:
                         "total_ops": int(row.get("total_ops", 0)) if row.get("total_ops") else 0
                     })
                 
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 logger.debug(f"[{job_id[:8]}] Hot tables query completed in {duration:.2f}s, found {len(result['tables'])} tables")
         finally:
-            conn.close()
+            _release_connection(host, conn, timeout=_HOT_TABLES_TIMEOUT)
             
     except OperationalError as e:
         error_msg = str(e)
@@ -746,33 +990,56 @@ def _collect_hot_tables(host: HostConfig, job_id: str) -> Dict[str, Any]:
     return result
 
 
+def _get_job_host_id(job_id: str, host_id: str) -> Optional[str]:
+    """Look up the JobHost primary key for a job/host pair."""
+    with get_db_context() as db:
+        row = db.query(JobHost.id).filter(
+            JobHost.job_id == job_id,
+            JobHost.host_id == host_id
+        ).first()
+        return row.id if row else None
+
+
 def _update_host_status(
-    job_id: str,
-    host_id: str,
+    job_host_id: Optional[str],
     status: HostJobStatus,
     error_message: Optional[str] = None,
-    mysql_version: Optional[str] = None
+    mysql_version: Optional[str] = None,
+    db: Optional[Session] = None
 ) -> None:
-    """Update the status of a job host in the database."""
+    """
+    Update the status of a job host in the database (single UPDATE by primary key).
+    
+    When a session is given the UPDATE joins its transaction and the caller
+    commits; otherwise a short session of its own is used.
+    """
+    if job_host_id is None:
+        return
+    
+    values: Dict[str, Any] = {"status": status}
+    if status == HostJobStatus.running:
+        values["started_at"] = datetime.utcnow()
+        if mysql_version:
+            values["mysql_version"] = mysql_version
+    elif status in (HostJobStatus.completed, HostJobStatus.failed):
+        values["completed_at"] = datetime.utcnow()
+    if error_message:
+        values["error_message"] = error_message
+    
+    stmt = update(JobHost).where(JobHost.id == job_host_id).values(**values)
+    if db is not None:
+        db.execute(stmt)
+        return
     with get_db_context() as db:
-        job_host = db.query(JobHost).filter(
-            JobHost.job_id == job_id,
-            JobHost.host_id == host_id
-        ).first()
-        
-        if job_host:
-            job_host.status = status
-            if status == HostJobStatus.running:
-                job_host.started_at = datetime.utcnow()
-                if mysql_version:
-                    job_host.mysql_version = mysql_version
-            elif status in (HostJobStatus.completed, HostJobStatus.failed):
-                job_host.completed_at = datetime.utcnow()
-            if error_message:
-                job_host.error_message = error_message
+        db.execute(stmt)
 
 
-def run_collection_job(job_id: str, host_ids: list[str], collect_hot_tables: bool = False) -> None:
+def run_collection_job(
+    job_id: str,
+    host_ids: list[str],
+    collect_hot_tables: bool = False,
+    db: Optional[Session] = None
+) -> None:
     """
     Run collection job for multiple hosts (background task).
     
@@ -780,75 +1047,114 @@ def run_collection_job(job_id: str, host_ids: list[str], collect_hot_tables: boo
         job_id: Job identifier
         host_ids: List of host IDs to collect from
         collect_hot_tables: Whether to query performance_schema for hot tables
+        db: Session to run the job's writes through (one is opened if not given)
     """
+    if db is None:
+        with get_db_context() as db:
+            return run_collection_job(job_id, host_ids, collect_hot_tables, db)
+    
     logger.info(f"[{job_id[:8]}] Job STARTED - collecting from {len(host_ids)} host(s)")
     
-    # Log host details
-    for host_id in host_ids:
-        host = get_host_by_id(host_id)
+    # Resolve every host once, then log host details
+    hosts_by_id = load_hosts_by_id(include_disabled=True)
+    hosts = {host_id: hosts_by_id.get(host_id) for host_id in host_ids}
+    for host in hosts.values():
         if host:
             logger.info(f"[{job_id[:8]}] Target host: {host.label} -> {host.host}:{host.port} (user: {host.user})")
     
-    # Calculate expected DB connections (3 commands per host)
-    expected_connections = len(host_ids) * len(COMMANDS)
-    logger.info(f"[{job_id[:8]}] Expected DB connections: {expected_connections} ({len(COMMANDS)} commands × {len(host_ids)} hosts)")
+    # One pooled connection per host carries all commands
+    logger.info(f"[{job_id[:8]}] Expected DB connections: {len(host_ids)} ({len(COMMANDS)} commands batched per host)")
     
-    job_start = datetime.now()
+    job_start = time.monotonic()
     
-    # Update job status to running
-    with get_db_context() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            job.status = JobStatus.running
+    # This thread owns the session: it writes the job row and every host's
+    # terminal status. Host workers only record their running transition.
+    # Update job status to running, and resolve JobHost ids for direct status updates.
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if job:
+        job.status = JobStatus.running
+    job_host_ids = dict(
+        db.query(JobHost.host_id, JobHost.id).filter(JobHost.job_id == job_id).all()
+    )
+    db.commit()
+    invalidate_job_status(job_id)
     
     # Collect from all hosts IN PARALLEL
     success_count = 0
     logger.info(f"[{job_id[:8]}] Starting PARALLEL collection for {len(host_ids)} hosts")
     
-    # Use ThreadPoolExecutor to run host collections in parallel
-    with ThreadPoolExecutor(max_workers=min(len(host_ids), 10)) as executor:
-        # Submit all host collection tasks
-        future_to_host = {
-            executor.submit(collect_host_data, job_id, host_id, collect_hot_tables): host_id
-            for host_id in host_ids
-        }
+    # Submit all host collection tasks to the shared executor
+    future_to_host = {
+        _EXECUTOR.submit(
+            _collect_host_data, job_id, host_id, collect_hot_tables,
+            job_host_ids.get(host_id), hosts[host_id]
+        ): host_id
+        for host_id in host_ids
+    }
+    
+    # Wait for all to complete, count successes and record each host's
+    # terminal status. The last host's update is committed together with
+    # the job's terminal status below.
+    remaining = len(future_to_host)
+    for future in as_completed(future_to_host):
+        remaining -= 1
+        host_id = future_to_host[future]
+        host = hosts[host_id]
+        host_info = f"{host.label}" if host else host_id
+        try:
+            error = future.result()
+            if error is None:
+                success_count += 1
+                logger.info(f"[{job_id[:8]}] ✓ {host_info} completed successfully")
+            else:
+                logger.warning(f"[{job_id[:8]}] ✗ {host_info} failed")
+        except Exception as e:
+            error = str(e)
+            logger.exception(f"[{job_id[:8]}] ✗ {host_info} raised exception: {e}")
         
-        # Wait for all to complete and count successes
-        for future in as_completed(future_to_host):
-            host_id = future_to_host[future]
-            host = get_host_by_id(host_id)
-            host_info = f"{host.label}" if host else host_id
-            try:
-                success = future.result()
-                if success:
-                    success_count += 1
-                    logger.info(f"[{job_id[:8]}] ✓ {host_info} completed successfully")
-                else:
-                    logger.warning(f"[{job_id[:8]}] ✗ {host_info} failed")
-            except Exception as e:
-                logger.exception(f"[{job_id[:8]}] ✗ {host_info} raised exception: {e}")
+        status = HostJobStatus.completed if error is None else HostJobStatus.failed
+        _update_host_status(job_host_ids.get(host_id), status, error, db=db)
+        if remaining:
+            db.commit()
+            invalidate_job_status(job_id)
     
     # Update job status based on results
-    job_elapsed = (datetime.now() - job_start).total_seconds()
+    job_elapsed = time.monotonic() - job_start
     failed_count = len(host_ids) - success_count
     
     # Calculate actual connections made
-    successful_connections = success_count * len(COMMANDS)
-    failed_connections = failed_count * len(COMMANDS)
+    successful_connections = success_count
+    failed_connections = failed_count
+    
+    if job:
+        if failed_count == len(host_ids):
+            job.status = JobStatus.failed
+            logger.error(f"[{job_id[:8]}] Job FAILED - all {len(host_ids)} hosts failed in {job_elapsed:.1f}s")
+            logger.error(f"[{job_id[:8]}] DB Connection Summary: {failed_connections} connections failed")
+        elif failed_count > 0:
+            job.status = JobStatus.completed  # Partial success
+            logger.warning(f"[{job_id[:8]}] Job COMPLETED (partial) - {success_count}/{len(host_ids)} succeeded in {job_elapsed:.1f}s")
+            logger.info(f"[{job_id[:8]}] DB Connection Summary: {successful_connections} successful, {failed_connections} failed")
+        else:
+            job.status = JobStatus.completed
+            logger.info(f"[{job_id[:8]}] Job COMPLETED - all {len(host_ids)} hosts succeeded in {job_elapsed:.1f}s")
+            logger.info(f"[{job_id[:8]}] DB Connection Summary: {successful_connections} connections completed successfully")
     
-    with get_db_context() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            if failed_count == len(host_ids):
-                job.status = JobStatus.failed
-                logger.error(f"[{job_id[:8]}] Job FAILED - all {len(host_ids)} hosts failed in {job_elapsed:.1f}s")
-                logger.error(f"[{job_id[:8]}] DB Connection Summary: {failed_connections} connections failed")
-            elif failed_count > 0:
-                job.status = JobStatus.completed  # Partial success
-                logger.warning(f"[{job_id[:8]}] Job COMPLETED (partial) - {success_count}/{len(host_ids)} succeeded in {job_elapsed:.1f}s")
-                logger.info(f"[{job_id[:8]}] DB Connection Summary: {successful_connections} successful, {failed_connections} failed")
-            else:
-                job.status = JobStatus.completed
-                logger.info(f"[{job_id[:8]}] Job COMPLETED - all {len(host_ids)} hosts succeeded in {job_elapsed:.1f}s")
-                logger.info(f"[{job_id[:8]}] DB Connection Summary: {successful_connections} connections completed successfully")
+    # Final commit: the last host's terminal status together with the job's
+    db.commit()
+    invalidate_job_status(job_id)
+
 
+def start_collection_job(job_id: str, host_ids: List[str], collect_hot_tables: bool = False) -> None:
+    """
+    Queue a collection job to run in the background and return immediately.
+    
+    Used by the web routes and the cron scheduler instead of spawning a thread
+    (or holding a request threadpool slot) per job.
+    """
+    def _log_crash(future) -> None:
+        error = future.exception()
+        if error:
+            logger.error(f"[{job_id[:8]}] Job crashed: {error}", exc_info=error)
+    
+    _JOB_EXECUTOR.submit(run_collection_job, job_id, list(host_ids), collect_hot_tables).add_done_callback(_log_crash)
@@ -1,11 +1,16 @@
 """Comparison logic for comparing two job runs."""
 
 from typing import Dict, List, Any, Optional, Tuple
-from difflib import unified_diff
 import json
 
+try:
+    # C implementation of difflib.SequenceMatcher (pip install mysql-awesome-stats-collector[fast])
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher as _SequenceMatcher
+
 # Allowlist of numeric Global Status metrics to compare
-GLOBAL_STATUS_COMPARE_ALLOWLIST = [
+GLOBAL_STATUS_COMPARE_ALLOWLIST = (
     "Threads_running",
     "Threads_connected",
     "Slow_queries",
@@ -16,7 +21,7 @@ GLOBAL_STATUS_COMPARE_ALLOWLIST = [
     "Opened_tables",
     "Table_open_cache_misses",
     "Table_open_cache_overflows",
-]
+)
 
 
 def compare_global_status(
@@ -32,19 +37,16 @@ def compare_global_status(
     for metric in GLOBAL_STATUS_COMPARE_ALLOWLIST:
         val_a = status_a.get(metric)
         val_b = status_b.get(metric)
+        if val_a is None and val_b is None:
+            continue
         
-        # Try to convert to numeric
+        # Try to convert to numeric (collected counters are already ints)
         try:
-            num_a = int(val_a) if val_a is not None else None
-            num_b = int(val_b) if val_b is not None else None
+            num_a = 0 if val_a is None else val_a if type(val_a) is int else int(val_a)
+            num_b = 0 if val_b is None else val_b if type(val_b) is int else int(val_b)
         except (ValueError, TypeError):
             continue
         
-        if num_a is None and num_b is None:
-            continue
-            
-        num_a = num_a or 0
-        num_b = num_b or 0
         delta = num_b - num_a
         
         # Determine direction (for these metrics, lower is usually better)
@@ -129,13 +131,17 @@ def compare_config(
     Compare config variables between two jobs.
     Returns list of {variable, value_a, value_b, changed}.
     """
-    all_keys = sorted(set(config_a.keys()) | set(config_b.keys()))
+    all_keys = sorted(config_a.keys() | config_b.keys())
     results = []
     
     for key in all_keys:
         val_a = config_a.get(key, "—")
         val_b = config_b.get(key, "—")
-        changed = str(val_a) != str(val_b)
+        # Same-typed values compare directly; only mixed types need the str() round-trip
+        if type(val_a) is type(val_b):
+            changed = val_a != val_b
+        else:
+            changed = str(val_a) != str(val_b)
         
         results.append({
             "variable": key,
@@ -235,30 +241,41 @@ def compare_innodb_text(
     lines_a = (text_a or "").splitlines()
     lines_b = (text_b or "").splitlines()
     
-    diff = unified_diff(
-        lines_a, 
-        lines_b, 
-        fromfile="Job A", 
-        tofile="Job B",
-        lineterm=""
-    )
-    
+    # Walk the matcher's grouped opcodes directly (same hunks as difflib.unified_diff)
+    matcher = _SequenceMatcher(None, lines_a, lines_b)
     result = []
-    for line in diff:
-        if line.startswith("+++") or line.startswith("---"):
-            result.append({"line": line, "type": "header"})
-        elif line.startswith("@@"):
-            result.append({"line": line, "type": "header"})
-        elif line.startswith("+"):
-            result.append({"line": line[1:], "type": "added"})
-        elif line.startswith("-"):
-            result.append({"line": line[1:], "type": "removed"})
-        else:
-            result.append({"line": line[1:] if line.startswith(" ") else line, "type": "context"})
+    for group in matcher.get_grouped_opcodes(3):
+        if not result:
+            result.append({"line": "--- Job A", "type": "header"})
+            result.append({"line": "+++ Job B", "type": "header"})
+        first, last = group[0], group[-1]
+        range_a = _format_hunk_range(first[1], last[2])
+        range_b = _format_hunk_range(first[3], last[4])
+        result.append({"line": f"@@ -{range_a} +{range_b} @@", "type": "header"})
+        
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                result.extend({"line": line, "type": "context"} for line in lines_a[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                result.extend({"line": line, "type": "removed"} for line in lines_a[i1:i2])
+            if tag in ("replace", "insert"):
+                result.extend({"line": line, "type": "added"} for line in lines_b[j1:j2])
     
     return result
 
 
+def _format_hunk_range(start: int, stop: int) -> str:
+    """Format a unified diff hunk range (same rules as difflib)."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
 def find_common_hosts(hosts_a: List[str], hosts_b: List[str]) -> List[str]:
     """Find hosts that exist in both jobs."""
     return sorted(set(hosts_a) & set(hosts_b))
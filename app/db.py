@@ -8,6 +8,7 @@ from contextlib import contextmanager
 from typing import Generator
 
 from .models import Base
+from .utils import MAX_PARALLEL_HOSTS, MAX_CONCURRENT_JOBS
 
 logger = logging.getLogger("masc.db")
 
@@ -15,10 +16,18 @@ logger = logging.getLogger("masc.db")
 DB_PATH = Path(__file__).parent.parent / "observer.db"
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# Pooled connections: every host worker and every running job thread can hold a
+# session at once, plus a margin for concurrent web requests; overflow absorbs bursts
+_WEB_REQUEST_SESSIONS = 5
+POOL_SIZE = MAX_PARALLEL_HOSTS + MAX_CONCURRENT_JOBS + _WEB_REQUEST_SESSIONS
+POOL_MAX_OVERFLOW = 10
+
 # Create engine with check_same_thread=False for SQLite
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
+    pool_size=POOL_SIZE,
+    max_overflow=POOL_MAX_OVERFLOW,
     echo=False
 )
 
@@ -1,34 +1,46 @@
 """FastAPI main application for MySQL Awesome Stats Collector (MASC)."""
 
+import asyncio
+import hashlib
 import logging
+import re
 import sys
 import uuid
 from datetime import datetime
 
-from fastapi import FastAPI, Request, Depends, Form, BackgroundTasks, Query
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, Request, Depends, Form, Query
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse, Response, FileResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 from pathlib import Path
-import json
+import orjson
+from functools import lru_cache
 
 from .db import init_db, get_db, get_db_context
 from .models import Job, JobHost, JobStatus, HostJobStatus, CronJob, DBHost, DBGroup
 from .utils import (
     load_hosts,
     load_all_hosts,
+    load_hosts_by_id,
     get_host_by_id,
+    invalidate_hosts_cache,
     generate_job_id,
     generate_job_host_id,
     get_host_output_dir,
     get_job_dir,
+    get_cached_job_status,
+    cache_job_status,
     read_file_safe,
     read_json_safe,
+    read_json_cached,
+    scan_output_dir,
 )
-from .collector import run_collection_job
-from .parser import get_key_metrics, parse_innodb_status_structured, CONFIG_VARIABLES_ALLOWLIST, evaluate_config_health
+from .collector import start_collection_job, drain_pools
+from .parser import get_key_metrics, parse_innodb_status_structured, filter_processlist, processlist_search_keys, CONFIG_VARIABLES_ALLOWLIST, evaluate_config_health
 from . import __version__
 
 # Setup logging
@@ -44,7 +56,8 @@ logger = logging.getLogger("masc")
 app = FastAPI(
     title="MySQL Awesome Stats Collector",
     description="Collect and visualize MySQL diagnostics from multiple hosts",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Log startup configuration
@@ -120,9 +133,28 @@ templates.env.filters["format_bytes"] = format_bytes
 templates.env.filters["format_number"] = format_number
 templates.env.filters["format_uptime"] = format_uptime
 
+def _template_json_dumps(obj, **kwargs) -> str:
+    """orjson-backed dumps for Jinja's |tojson (it HTML-escapes the result itself)."""
+    option = orjson.OPT_NON_STR_KEYS
+    if kwargs.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option).decode()
+
+
+# |tojson embeds whole artifacts (global status, config variables and health, hot tables) in host pages
+templates.env.policies["json.dumps_function"] = _template_json_dumps
+
 # Add version to template globals (available in all templates)
 templates.env.globals["app_version"] = __version__
 
+# Config allowlist for the host page's config tab, serialized once
+templates.env.globals["config_allowlist_json"] = orjson.dumps(CONFIG_VARIABLES_ALLOWLIST).decode()
+
+# The host page is the heaviest render: resolve its templates once and render
+# them directly rather than going through TemplateResponse's per-call lookup
+_HOST_DETAIL_TEMPLATE = templates.get_template("host_detail.html")
+_ERROR_TEMPLATE = templates.get_template("error.html")
+
 
 # Mount static files - use app/static for package compatibility
 STATIC_DIR = BASE_DIR / "static"
@@ -202,7 +234,6 @@ async def index(request: Request, db: Session = Depends(get_db)):
 @app.post("/jobs/create")
 async def create_job(
     request: Request,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Create a new collection job."""
@@ -227,8 +258,7 @@ async def create_job(
     job_id = generate_job_id()
     job_display = f"'{job_name}' ({job_id[:8]})" if job_name else job_id[:8]
     logger.info(f"Creating job {job_display} for {len(selected_hosts)} host(s)")
-    all_hosts = load_hosts()
-    hosts_map = {h.id: h for h in all_hosts}
+    hosts_map = load_hosts_by_id()
     for host_id in selected_hosts:
         h = hosts_map.get(host_id)
         if h:
@@ -237,21 +267,23 @@ async def create_job(
             logger.warning(f"  - {host_id}: (unknown host)")
     job = Job(id=job_id, name=job_name, status=JobStatus.pending)
     db.add(job)
-    
-    # Create job hosts
-    for host_id in selected_hosts:
-        job_host = JobHost(
-            id=generate_job_host_id(),
-            job_id=job_id,
-            host_id=host_id,
-            status=HostJobStatus.pending
-        )
-        db.add(job_host)
+    db.flush()
+    
+    # Create job hosts (one multi-row INSERT)
+    db.execute(insert(JobHost), [
+        {
+            "id": generate_job_host_id(),
+            "job_id": job_id,
+            "host_id": host_id,
+            "status": HostJobStatus.pending,
+        }
+        for host_id in selected_hosts
+    ])
     
     db.commit()
     
     # Start background collection (with optional hot tables)
-    background_tasks.add_task(run_collection_job, job_id, list(selected_hosts), collect_hot_tables)
+    start_collection_job(job_id, list(selected_hosts), collect_hot_tables)
     
     if collect_hot_tables:
         logger.info(f"  Hot Tables collection: ENABLED")
@@ -280,18 +312,31 @@ async def list_jobs(
     total_jobs = db.query(Job).count()
     total_pages = (total_jobs + per_page - 1) // per_page
     
-    # Fetch paginated jobs (hosts are eager-loaded via relationship)
-    jobs = db.query(Job).order_by(Job.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
+    # Fetch paginated jobs; hosts come from one extra SELECT ... IN query rather than
+    # a joined eager load, which would force the LIMIT/OFFSET into a subquery
+    jobs = (
+        db.query(Job)
+        .options(selectinload(Job.hosts))
+        .order_by(Job.created_at.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .all()
+    )
     
-    # Enrich with host counts and labels
+    # Enrich with host counts and labels (single pass over each job's hosts)
     jobs_data = []
     for job in jobs:
         host_count = len(job.hosts)
-        completed_count = sum(1 for h in job.hosts if h.status == HostJobStatus.completed)
-        failed_count = sum(1 for h in job.hosts if h.status == HostJobStatus.failed)
-        
-        # Get host labels using pre-loaded map (fast!)
-        host_labels = [host_label_map.get(jh.host_id, jh.host_id) for jh in job.hosts]
+        completed_count = 0
+        failed_count = 0
+        host_labels = []
+        for jh in job.hosts:
+            if jh.status == HostJobStatus.completed:
+                completed_count += 1
+            elif jh.status == HostJobStatus.failed:
+                failed_count += 1
+            # Get host labels using pre-loaded map (fast!)
+            host_labels.append(host_label_map.get(jh.host_id, jh.host_id))
         
         jobs_data.append({
             "job": job,
@@ -330,8 +375,7 @@ async def job_detail(request: Request, job_id: str, db: Session = Depends(get_db
     
     # Enrich hosts with labels and replica status
     hosts_data = []
-    all_hosts = load_hosts()
-    hosts_map = {h.id: h for h in all_hosts}
+    hosts_map = load_hosts_by_id()
     
     for job_host in job.hosts:
         host_config = hosts_map.get(job_host.host_id)
@@ -360,7 +404,6 @@ async def job_detail(request: Request, job_id: str, db: Session = Depends(get_db
 @app.post("/jobs/{job_id}/rerun")
 async def rerun_job(
     job_id: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Re-run a job with the same hosts and settings."""
@@ -386,7 +429,7 @@ async def rerun_job(
             break
     
     # Create new job (no name to avoid "Re-run of Re-run of..." chains)
-    new_job_id = str(uuid.uuid4())
+    new_job_id = generate_job_id()
     
     new_job = Job(id=new_job_id, name=None, status=JobStatus.pending)
     db.add(new_job)
@@ -394,7 +437,7 @@ async def rerun_job(
     # Create job_host entries
     for host_id in host_ids:
         job_host = JobHost(
-            id=str(uuid.uuid4()),
+            id=generate_job_host_id(),
             job_id=new_job_id,
             host_id=host_id,
             status=HostJobStatus.pending
@@ -404,7 +447,7 @@ async def rerun_job(
     db.commit()
     
     # Start collection in background
-    background_tasks.add_task(run_collection_job, new_job_id, host_ids, collect_hot_tables)
+    start_collection_job(new_job_id, host_ids, collect_hot_tables)
     
     return RedirectResponse(url=f"/jobs/{new_job_id}", status_code=303)
 
@@ -413,6 +456,101 @@ async def rerun_job(
 # HOST OUTPUT VIEW
 # =============================================================================
 
+@lru_cache(maxsize=512)
+def _parse_innodb_structured_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Structured InnoDB status for a host's raw.txt, parsed at most once per file version."""
+    # Convert literal \n to actual newlines (MySQL escapes them in InnoDB status)
+    raw_output = read_file_safe(Path(path)) or ""
+    if '\\n' in raw_output:
+        raw_output = raw_output.replace('\\n', '\n')
+    return parse_innodb_status_structured(raw_output)
+
+
+def _file_version(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size) of a file for cache keys, or None if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _config_health_for(output_dir: Path, files: dict) -> dict:
+    """Config health for a host's snapshot, evaluated at most once per artifact version."""
+    return _evaluate_config_health_cached(
+        str(output_dir),
+        files.get("config_vars.json"),
+        files.get("global_status.json"),
+    )
+
+
+@lru_cache(maxsize=512)
+def _evaluate_config_health_cached(output_dir: str, config_version, status_version) -> dict:
+    """Evaluate config health; the version arguments only key the cache."""
+    output_path = Path(output_dir)
+    config_vars = read_json_cached(output_path / "config_vars.json", config_version) or {}
+    global_status = read_json_cached(output_path / "global_status.json", status_version) or {}
+    # Walk the (small) allowlist rather than every server variable
+    important_vars = {k: config_vars[k] for k in CONFIG_VARIABLES_ALLOWLIST if k in config_vars}
+    return evaluate_config_health(important_vars, global_status)
+
+
+def _find_master_info(job: Job, replica_status: dict) -> Optional[dict]:
+    """Find the replica's master among the job's hosts and summarize its binlog position."""
+    master_host_addr = replica_status.get("master_host")
+    master_port = replica_status.get("master_port", 3306)
+    
+    # Look through other hosts in this job to find the master
+    hosts_by_id = load_hosts_by_id(include_disabled=True)
+    for job_host_entry in job.hosts:
+        other_host_config = hosts_by_id.get(job_host_entry.host_id)
+        if not other_host_config:
+            continue
+        # Check if this host matches the master address
+        if not (other_host_config.host == master_host_addr or
+                master_host_addr in other_host_config.host):
+            continue
+        if other_host_config.port != master_port:
+            continue
+        
+        # Found the master! Load its master_status
+        master_output_dir = get_host_output_dir(job.id, job_host_entry.host_id)
+        master_master_status = read_json_safe(master_output_dir / "master_status.json") or {}
+        if not master_master_status.get("is_master"):
+            return None
+        return {
+            "host_id": job_host_entry.host_id,
+            "label": other_host_config.label,
+            "host": other_host_config.host,
+            "port": other_host_config.port,
+            "binlog_file": master_master_status.get("file"),
+            "binlog_position": master_master_status.get("position"),
+            "executed_gtid_set": master_master_status.get("executed_gtid_set"),
+        }
+    return None
+
+
+def _master_candidates(job: Job) -> list:
+    """
+    What _find_master_info reads, without reading it: each job host's address and
+    label plus its master_status.json (mtime_ns, size). Feeds the host page's ETag.
+    """
+    hosts_by_id = load_hosts_by_id(include_disabled=True)
+    candidates = []
+    for job_host_entry in job.hosts:
+        host_config = hosts_by_id.get(job_host_entry.host_id)
+        if not host_config:
+            continue
+        path = get_host_output_dir(job.id, job_host_entry.host_id) / "master_status.json"
+        try:
+            st = path.stat()
+            version = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            version = None
+        candidates.append((job_host_entry.host_id, host_config.host, host_config.port, host_config.label, version))
+    return candidates
+
+
 @app.get("/jobs/{job_id}/hosts/{host_id}", response_class=HTMLResponse)
 async def host_detail(
     request: Request,
@@ -426,43 +564,54 @@ async def host_detail(
     db: Session = Depends(get_db)
 ):
     """Host output detail page with tabs."""
-    # Convert min_time to int if provided and not empty
-    min_time_int: Optional[int] = None
-    if min_time and min_time.strip():
-        try:
-            min_time_int = int(min_time)
-        except ValueError:
-            min_time_int = None
-    
-    # Verify job and host exist
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        return templates.TemplateResponse("error.html", {
-            "request": request,
-            "error": "Job not found",
-            "page_title": "Error"
-        }, status_code=404)
-    
-    job_host = db.query(JobHost).filter(
-        JobHost.job_id == job_id,
+    # Convert min_time to int if provided and numeric (no exception on the
+    # common empty case)
+    min_time_str = (min_time or "").strip()
+    digits = min_time_str[1:] if min_time_str[:1] in ("-", "+") else min_time_str
+    min_time_int: Optional[int] = int(min_time_str) if digits.isdecimal() else None
+    
+    # Verify job and host exist (one query; a miss is rare, so the error
+    # message is worked out afterwards)
+    row = db.query(Job, JobHost).join(JobHost, JobHost.job_id == Job.id).filter(
+        Job.id == job_id,
         JobHost.host_id == host_id
     ).first()
     
-    if not job_host:
-        return templates.TemplateResponse("error.html", {
+    if row is None:
+        job_exists = db.query(Job.id).filter(Job.id == job_id).first() is not None
+        return HTMLResponse(_ERROR_TEMPLATE.render({
             "request": request,
-            "error": "Host not found in this job",
+            "error": "Host not found in this job" if job_exists else "Job not found",
             "page_title": "Error"
-        }, status_code=404)
+        }), status_code=404)
+    
+    job, job_host = row
     
     # Get host config
     host_config = get_host_by_id(host_id)
     host_label = host_config.label if host_config else host_id
     
+    # Get output directory, and every artifact's (mtime, size) from one scan
+    output_dir = get_host_output_dir(job_id, host_id)
+    files = await run_in_threadpool(scan_output_dir, output_dir)
+    
+    # Nothing parsed (host pending, running, or failed before its output could be
+    # parsed - a failed host may still have a raw.txt holding just the error):
+    # render the small status page instead of the full tabbed view. The parsed
+    # artifacts are written together, so global_status.json stands for all of them.
+    if "raw.txt" not in files or "global_status.json" not in files:
+        return templates.TemplateResponse("host_detail_empty.html", {
+            "request": request,
+            "job": job,
+            "job_host": job_host,
+            "host_label": host_label,
+            "has_raw": "raw.txt" in files,
+            "page_title": f"{host_label} Output"
+        })
+    
     # Get all hosts in this job for the dropdown navigation
     job_hosts_list = []
-    all_host_configs = load_hosts()
-    host_config_map = {h.id: h for h in all_host_configs}
+    host_config_map = load_hosts_by_id()
     for jh in job.hosts:
         hc = host_config_map.get(jh.host_id)
         job_hosts_list.append({
@@ -471,80 +620,74 @@ async def host_detail(
             "status": jh.status.value,
         })
     
-    # Get output directory
-    output_dir = get_host_output_dir(job_id, host_id)
-    
-    # Load timing data (always available)
-    timing_data = read_json_safe(output_dir / "timing.json") or {}
-    
-    # Load replica status (always, for header display)
-    replica_status = read_json_safe(output_dir / "replica_status.json") or {}
-    
-    # Load master status (for master binlog position)
-    master_status = read_json_safe(output_dir / "master_status.json") or {}
-    
-    # Load buffer pool metrics (always, for summary card)
-    buffer_pool = read_json_safe(output_dir / "buffer_pool.json") or {}
-    
-    # Load hot tables (optional, only if collected)
-    hot_tables = read_json_safe(output_dir / "hot_tables.json") or {}
+    # Weak ETag over everything the page shows: artifact versions, job/host
+    # state, the query string, the app version and the inputs of the master
+    # lookup. It is built from file versions alone, so a matching reload returns
+    # 304 before any artifact is read; finished jobs never change, so their pages
+    # revalidate without loading or re-rendering anything.
+    etag_source = orjson.dumps([
+        __version__,
+        str(request.url.query),
+        sorted(files.items()),
+        job.name,
+        job.status,
+        job_host.status,
+        job_host.error_message,
+        job_host.mysql_version,
+        job_host.completed_at,
+        host_label,
+        job_hosts_list,
+        await run_in_threadpool(_master_candidates, job),
+    ])
+    etag = f'W/"{hashlib.blake2b(etag_source, digest_size=8).hexdigest()}"'
+    etag_headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=etag_headers)
+    
+    # Read every artifact in the threadpool, in parallel, so slow disk reads
+    # don't block the event loop. Files missing from the scan are skipped.
+    # Load ALL tab data upfront for client-side tab switching (no page refresh).
+    json_names = [name for name in (
+        "timing.json",
+        "replica_status.json",
+        "master_status.json",
+        "buffer_pool.json",
+        "hot_tables.json",
+        "innodb_health.json",
+        "global_status.json",
+        "config_vars.json",
+    ) if name in files]
+    *loaded, innodb_structured = await asyncio.gather(
+        *(run_in_threadpool(read_json_cached, output_dir / name, files[name]) for name in json_names),
+        # The page fetches raw.txt/innodb.txt text from host_output_file;
+        # raw.txt is only needed here for the (cached) structured parse.
+        run_in_threadpool(_parse_innodb_structured_cached, str(output_dir / "raw.txt"), *files["raw.txt"]),
+    )
+    artifacts = dict(zip(json_names, loaded))
     
-    # Load InnoDB health analysis (deadlocks, lock contention, hot indexes, etc.)
-    innodb_health = read_json_safe(output_dir / "innodb_health.json") or {}
+    timing_data = artifacts.get("timing.json") or {}  # always available
+    replica_status = artifacts.get("replica_status.json") or {}  # always, for header display
+    master_status = artifacts.get("master_status.json") or {}  # for master binlog position
+    buffer_pool = artifacts.get("buffer_pool.json") or {}  # always, for summary card
+    hot_tables = artifacts.get("hot_tables.json") or {}  # optional, only if collected
+    innodb_health = artifacts.get("innodb_health.json") or {}  # deadlocks, lock contention, hot indexes, etc.
     
-    # Load ALL tab data upfront for client-side tab switching (no page refresh)
     master_info = None  # Info about the master if this is a replica
     
-    # Raw output - convert literal \n to actual newlines (MySQL escapes them in InnoDB status)
-    raw_output = read_file_safe(output_dir / "raw.txt") or "No raw output available"
-    if raw_output and '\\n' in raw_output:
-        raw_output = raw_output.replace('\\n', '\n')
-    
-    # InnoDB
-    innodb_output = read_file_safe(output_dir / "innodb.txt") or "No InnoDB output available"
-    innodb_structured = parse_innodb_status_structured(raw_output)
-    
     # Global Status
-    global_status = read_json_safe(output_dir / "global_status.json") or {}
+    global_status = artifacts.get("global_status.json") or {}
     key_metrics = get_key_metrics(global_status)
     
-    # Processlist (all data - filtering is done client-side for better UX)
-    processlist = read_json_safe(output_dir / "processlist.json") or []
-    
     # Config
-    config_vars = read_json_safe(output_dir / "config_vars.json") or {}
-    important_vars = {k: v for k, v in config_vars.items() if k in CONFIG_VARIABLES_ALLOWLIST}
-    config_health = evaluate_config_health(important_vars, global_status)
+    config_vars = artifacts.get("config_vars.json") or {}
+    config_health = _config_health_for(output_dir, files)
     
     # Replication - find master info if this is a replica
     if replica_status.get("is_replica") and replica_status.get("master_host"):
-            master_host_addr = replica_status.get("master_host")
-            master_port = replica_status.get("master_port", 3306)
-            
-            # Look through other hosts in this job to find the master
-            for job_host_entry in job.hosts:
-                other_host_config = get_host_by_id(job_host_entry.host_id)
-                if other_host_config:
-                    # Check if this host matches the master address
-                    if (other_host_config.host == master_host_addr or 
-                        master_host_addr in other_host_config.host):
-                        if other_host_config.port == master_port:
-                            # Found the master! Load its master_status
-                            master_output_dir = get_host_output_dir(job_id, job_host_entry.host_id)
-                            master_master_status = read_json_safe(master_output_dir / "master_status.json") or {}
-                            if master_master_status.get("is_master"):
-                                master_info = {
-                                    "host_id": job_host_entry.host_id,
-                                    "label": other_host_config.label,
-                                    "host": other_host_config.host,
-                                    "port": other_host_config.port,
-                                    "binlog_file": master_master_status.get("file"),
-                                    "binlog_position": master_master_status.get("position"),
-                                    "executed_gtid_set": master_master_status.get("executed_gtid_set"),
-                                }
-                            break
-    
-    return templates.TemplateResponse("host_detail.html", {
+        master_info = await run_in_threadpool(_find_master_info, job, replica_status)
+    
+    return HTMLResponse(_HOST_DETAIL_TEMPLATE.render({
         "request": request,
         "job": job,
         "job_host": job_host,
@@ -552,15 +695,11 @@ async def host_detail(
         "host_label": host_label,
         "job_hosts_list": job_hosts_list,
         "tab": tab,
-        "raw_output": raw_output,
-        "innodb_output": innodb_output,
         "innodb_structured": innodb_structured,
         "global_status": global_status,
-        "key_metrics": json.dumps(key_metrics) if key_metrics else "{}",
-        "processlist": processlist,
+        "key_metrics": orjson.dumps(key_metrics).decode() if key_metrics else "{}",
         "config_vars": config_vars,
         "config_health": config_health,
-        "config_allowlist": CONFIG_VARIABLES_ALLOWLIST,
         "user_filter": user_filter or "",
         "state_filter": state_filter or "",
         "min_time": min_time_int if min_time_int is not None else "",
@@ -573,7 +712,31 @@ async def host_detail(
         "hot_tables": hot_tables,
         "innodb_health": innodb_health,
         "page_title": f"{host_label} Output"
-    })
+    }), headers=etag_headers)
+
+
+# Text artifacts the host detail page loads lazily
+HOST_OUTPUT_FILES = {
+    "raw": "raw.txt",
+    "innodb": "innodb.txt",
+}
+
+
+@app.get("/jobs/{job_id}/hosts/{host_id}/output/{name}")
+async def host_output_file(job_id: str, host_id: str, name: str, db: Session = Depends(get_db)):
+    """Serve a host's raw.txt / innodb.txt straight from disk (fetched by the detail page)."""
+    filename = HOST_OUTPUT_FILES.get(name)
+    job_host = db.query(JobHost.id).filter(
+        JobHost.job_id == job_id,
+        JobHost.host_id == host_id
+    ).first()
+    if not filename or not job_host:
+        return PlainTextResponse("Not found", status_code=404)
+    
+    path = get_host_output_dir(job_id, host_id) / filename
+    if not path.is_file():
+        return PlainTextResponse("Not found", status_code=404)
+    return FileResponse(path, media_type="text/plain; charset=utf-8")
 
 
 # =============================================================================
@@ -583,36 +746,93 @@ async def host_detail(
 @app.get("/api/jobs/{job_id}/status")
 async def get_job_status(job_id: str, db: Session = Depends(get_db)):
     """Get current job status with real-time command progress (for polling)."""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    # Concurrent pollers of the same job share one DB read per TTL window
+    body = get_cached_job_status(job_id)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
     
-    if not job:
-        return {"error": "Job not found"}
+    # Column-only queries: polling never needs full ORM objects
+    job_status = db.query(Job.status).filter(Job.id == job_id).scalar()
+    
+    if job_status is None:
+        return Response(content=orjson.dumps({"error": "Job not found"}), media_type="application/json")
+    
+    rows = db.query(JobHost.host_id, JobHost.status, JobHost.error_message).filter(
+        JobHost.job_id == job_id
+    ).all()
     
     hosts_status = []
-    for job_host in job.hosts:
+    for host_id, status, error_message in rows:
         host_info = {
-            "host_id": job_host.host_id,
-            "status": job_host.status.value,
-            "error_message": job_host.error_message
+            "host_id": host_id,
+            "status": status.value,
+            "error_message": error_message
         }
         
         # Read real-time progress for running hosts
-        if job_host.status.value == "running":
-            progress_file = get_job_dir(job_id) / job_host.host_id / "progress.json"
-            if progress_file.exists():
-                try:
-                    with open(progress_file) as f:
-                        host_info["progress"] = json.load(f)
-                except Exception:
-                    pass
+        if status == HostJobStatus.running:
+            progress_file = get_job_dir(job_id) / host_id / "progress.json"
+            try:
+                host_info["progress"] = orjson.loads(progress_file.read_bytes())
+            except Exception:
+                # Not written yet (or mid-write)
+                pass
         
         hosts_status.append(host_info)
     
-    return {
+    # Serialize directly: this endpoint is polled, so skip jsonable_encoder
+    payload = {
         "job_id": job_id,
-        "status": job.status.value,
+        "status": job_status.value,
         "hosts": hosts_status
     }
+    body = orjson.dumps(payload)
+    cache_job_status(job_id, body)
+    return Response(content=body, media_type="application/json")
+
+
+@lru_cache(maxsize=64)
+def _processlist_json_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """Serialized processlist.json (unfiltered); the stat fields only key the cache."""
+    return orjson.dumps(read_json_safe(Path(path)) or [])
+
+
+@lru_cache(maxsize=64)
+def _processlist_search_cached(path: str, mtime_ns: int, size: int) -> tuple:
+    """processlist.json rows with their lowercased search keys; the stat fields only key the cache."""
+    processes = read_json_safe(Path(path)) or []
+    return processes, processlist_search_keys(processes)
+
+
+@app.get("/api/jobs/{job_id}/hosts/{host_id}/processlist")
+async def get_host_processlist(
+    job_id: str,
+    host_id: str,
+    user: Optional[str] = None,
+    state: Optional[str] = None,
+    min_time: Optional[int] = None,
+    query: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Processlist rows for a host (loaded by the host page; filtering is usually done client-side)."""
+    job_host = db.query(JobHost.id).filter(
+        JobHost.job_id == job_id,
+        JobHost.host_id == host_id
+    ).first()
+    if not job_host:
+        return Response(content=orjson.dumps({"error": "Host not found in this job"}), media_type="application/json", status_code=404)
+    
+    path = get_host_output_dir(job_id, host_id) / "processlist.json"
+    version = _file_version(path)
+    if version is None:
+        return Response(content=b"[]", media_type="application/json")
+    
+    if not (user or state or query) and min_time is None:
+        body = await run_in_threadpool(_processlist_json_cached, str(path), *version)
+    else:
+        processes, search_keys = await run_in_threadpool(_processlist_search_cached, str(path), *version)
+        body = orjson.dumps(filter_processlist(processes, user, state, min_time, query, search_keys))
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/jobs/{job_id}/raw-outputs")
@@ -624,23 +844,23 @@ async def get_all_raw_outputs(job_id: str, db: Session = Depends(get_db)):
         return {"error": "Job not found"}
     
     outputs = []
+    hosts_by_id = load_hosts_by_id(include_disabled=True)
     for job_host in job.hosts:
-        host = get_host_by_id(job_host.host_id)
+        host = hosts_by_id.get(job_host.host_id)
         if not host:
             continue
         
         raw_file = get_job_dir(job_id) / job_host.host_id / "raw.txt"
-        if raw_file.exists():
-            try:
-                with open(raw_file, 'r') as f:
-                    content = f.read()
+        try:
+            content = read_file_safe(raw_file)
+            if content is not None:
                 outputs.append({
                     "host_id": job_host.host_id,
                     "label": host.label,
                     "content": content
                 })
-            except Exception:
-                pass
+        except Exception:
+            pass
     
     return {"outputs": outputs}
 
@@ -662,25 +882,71 @@ async def compare_page(request: Request, db: Session = Depends(get_db)):
     })
 
 
-@app.get("/compare/result", response_class=HTMLResponse)
-async def compare_result(
-    request: Request,
-    job_a: str = Query(..., description="Job A ID"),
-    job_b: str = Query(..., description="Job B ID"),
-    db: Session = Depends(get_db)
-):
-    """Compare two jobs and show results."""
+def _compare_host(job_a: str, job_b: str, host_id: str) -> dict:
+    """Load one host's outputs from both jobs and build its comparison (runs in a worker thread)."""
     from .compare import (
         compare_global_status,
         compare_processlist,
         compare_config,
         compare_innodb_text,
         compare_buffer_pool,
-        find_common_hosts,
         detect_regressions,
-        refine_regressions,
     )
     
+    # Load data from filesystem
+    dir_a = get_host_output_dir(job_a, host_id)
+    dir_b = get_host_output_dir(job_b, host_id)
+    
+    # Global Status
+    gs_a = read_json_safe(dir_a / "global_status.json") or {}
+    gs_b = read_json_safe(dir_b / "global_status.json") or {}
+    
+    # Processlist
+    pl_a = read_json_safe(dir_a / "processlist.json") or []
+    pl_b = read_json_safe(dir_b / "processlist.json") or []
+    
+    # Config
+    cfg_a = read_json_safe(dir_a / "config_vars.json") or {}
+    cfg_b = read_json_safe(dir_b / "config_vars.json") or {}
+    
+    # InnoDB (raw text)
+    innodb_a = read_file_safe(dir_a / "innodb.txt") or ""
+    innodb_b = read_file_safe(dir_b / "innodb.txt") or ""
+    
+    # Buffer Pool
+    bp_a = read_json_safe(dir_a / "buffer_pool.json") or {}
+    bp_b = read_json_safe(dir_b / "buffer_pool.json") or {}
+    
+    # System info for regression detection (use config if available)
+    system_info = {
+        "cpu_cores": cfg_b.get("innodb_read_io_threads", 4),  # Approximate from config
+    }
+    
+    # Detect regressions (raw)
+    raw_regressions = detect_regressions(gs_a, gs_b, pl_a, pl_b, system_info)
+    
+    return {
+        "global_status": compare_global_status(gs_a, gs_b),
+        "processlist": compare_processlist(pl_a, pl_b),
+        "config": compare_config(cfg_a, cfg_b),
+        "innodb": compare_innodb_text(innodb_a, innodb_b),
+        "buffer_pool": compare_buffer_pool(bp_a, bp_b),
+        "raw_regressions": raw_regressions,
+        "gs_a": gs_a,
+        "gs_b": gs_b,
+    }
+
+
+@app.get("/compare/result", response_class=HTMLResponse)
+async def compare_result(
+    request: Request,
+    job_a: str = Query(..., description="Job A ID"),
+    job_b: str = Query(..., description="Job B ID"),
+    db: Session = Depends(get_db)
+):
+    """Compare two jobs and show results."""
+    from .compare import find_common_hosts, refine_regressions
+    
     # Validate same job not selected
     if job_a == job_b:
         jobs = db.query(Job).filter(Job.status == JobStatus.completed).order_by(Job.created_at.desc()).all()
@@ -715,51 +981,12 @@ async def compare_result(
     all_hosts = load_hosts()
     host_labels = {h.id: h.label for h in all_hosts}
     
-    # Build comparisons for each common host
-    comparisons = {}
-    for host_id in common_hosts:
-        # Load data from filesystem
-        dir_a = get_host_output_dir(job_a, host_id)
-        dir_b = get_host_output_dir(job_b, host_id)
-        
-        # Global Status
-        gs_a = read_json_safe(dir_a / "global_status.json") or {}
-        gs_b = read_json_safe(dir_b / "global_status.json") or {}
-        
-        # Processlist
-        pl_a = read_json_safe(dir_a / "processlist.json") or []
-        pl_b = read_json_safe(dir_b / "processlist.json") or []
-        
-        # Config
-        cfg_a = read_json_safe(dir_a / "config_vars.json") or {}
-        cfg_b = read_json_safe(dir_b / "config_vars.json") or {}
-        
-        # InnoDB (raw text)
-        innodb_a = read_file_safe(dir_a / "innodb.txt") or ""
-        innodb_b = read_file_safe(dir_b / "innodb.txt") or ""
-        
-        # Buffer Pool
-        bp_a = read_json_safe(dir_a / "buffer_pool.json") or {}
-        bp_b = read_json_safe(dir_b / "buffer_pool.json") or {}
-        
-        # System info for regression detection (use config if available)
-        system_info = {
-            "cpu_cores": cfg_b.get("innodb_read_io_threads", 4),  # Approximate from config
-        }
-        
-        # Detect regressions (raw)
-        raw_regressions = detect_regressions(gs_a, gs_b, pl_a, pl_b, system_info)
-        
-        comparisons[host_id] = {
-            "global_status": compare_global_status(gs_a, gs_b),
-            "processlist": compare_processlist(pl_a, pl_b),
-            "config": compare_config(cfg_a, cfg_b),
-            "innodb": compare_innodb_text(innodb_a, innodb_b),
-            "buffer_pool": compare_buffer_pool(bp_a, bp_b),
-            "raw_regressions": raw_regressions,
-            "gs_a": gs_a,
-            "gs_b": gs_b,
-        }
+    # Build comparisons for each common host; hosts are independent, so their
+    # file reads and diffs run concurrently in the threadpool
+    host_comparisons = await asyncio.gather(
+        *(run_in_threadpool(_compare_host, job_a, job_b, host_id) for host_id in common_hosts)
+    )
+    comparisons = dict(zip(common_hosts, host_comparisons))
     
     # Collect all raw regressions for cross-host correlation
     all_host_regressions = [comparisons[h]["raw_regressions"] for h in common_hosts]
@@ -832,7 +1059,7 @@ async def list_crons(request: Request, db: Session = Depends(get_db)):
     # Enrich crons with host labels
     cron_data = []
     for cron in crons:
-        host_ids = json.loads(cron.host_ids) if cron.host_ids else []
+        host_ids = orjson.loads(cron.host_ids) if cron.host_ids else []
         host_labels = [host_map[hid].label if hid in host_map else hid for hid in host_ids]
         cron_data.append({
             "cron": cron,
@@ -866,7 +1093,7 @@ async def create_cron(
     cron = CronJob(
         id=cron_id,
         name=name,
-        host_ids=json.dumps(host_ids),
+        host_ids=orjson.dumps(host_ids).decode(),
         interval_minutes=interval_minutes,
         collect_hot_tables=collect_hot_tables,
         enabled=True,
@@ -923,7 +1150,6 @@ async def delete_cron(cron_id: str, db: Session = Depends(get_db)):
 @app.post("/crons/{cron_id}/run-now")
 async def run_cron_now(
     cron_id: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Manually trigger a cron job to run immediately."""
@@ -932,10 +1158,10 @@ async def run_cron_now(
         return RedirectResponse(url="/crons", status_code=302)
     
     # Parse host IDs
-    host_ids = json.loads(cron.host_ids)
+    host_ids = orjson.loads(cron.host_ids)
     
     # Create a new collection job
-    job_id = str(uuid.uuid4())
+    job_id = generate_job_id()
     job_name = f"[Cron] {cron.name} (Manual)"
     
     new_job = Job(
@@ -947,7 +1173,7 @@ async def run_cron_now(
     
     for host_id in host_ids:
         job_host = JobHost(
-            id=str(uuid.uuid4()),
+            id=generate_job_host_id(),
             job_id=job_id,
             host_id=host_id,
             status=HostJobStatus.pending
@@ -962,7 +1188,7 @@ async def run_cron_now(
     db.commit()
     
     # Run collection in background
-    background_tasks.add_task(run_collection_job, job_id, host_ids, cron.collect_hot_tables)
+    start_collection_job(job_id, host_ids, cron.collect_hot_tables)
     
     logger.info(f"Manually triggered cron '{cron.name}' - job {job_id[:8]}")
     
@@ -986,7 +1212,7 @@ async def update_cron(
         return RedirectResponse(url="/crons", status_code=302)
     
     cron.name = name
-    cron.host_ids = json.dumps(host_ids)
+    cron.host_ids = orjson.dumps(host_ids).decode()
     cron.interval_minutes = interval_minutes
     cron.collect_hot_tables = collect_hot_tables
     cron.updated_at = datetime.utcnow()
@@ -1064,8 +1290,6 @@ async def create_group(
     db: Session = Depends(get_db)
 ):
     """Create a new host group."""
-    import re
-    
     # Auto-generate ID from name (slug format)
     group_id = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
     
@@ -1127,6 +1351,7 @@ async def delete_group(group_id: str, db: Session = Depends(get_db)):
         name = group.name
         db.delete(group)
         db.commit()
+        invalidate_hosts_cache()
         logger.info(f"Deleted group: {name}")
     
     return RedirectResponse(url="/hosts", status_code=302)
@@ -1145,8 +1370,6 @@ async def create_host(
     db: Session = Depends(get_db)
 ):
     """Create a new host."""
-    import re
-    
     # Auto-generate ID from label (slug format)
     host_id = re.sub(r'[^a-z0-9]+', '-', label.lower()).strip('-')
     
@@ -1171,6 +1394,7 @@ async def create_host(
     
     db.add(new_host)
     db.commit()
+    invalidate_hosts_cache()
     
     logger.info(f"Created host: {label} ({host}:{port}) with ID '{host_id}'")
     
@@ -1206,6 +1430,8 @@ async def update_host(
     db_host.updated_at = datetime.utcnow()
     
     db.commit()
+    invalidate_hosts_cache()
+    drain_pools()
     
     logger.info(f"Updated host: {label} ({host}:{port})")
     
@@ -1222,6 +1448,8 @@ async def toggle_host(host_id: str, db: Session = Depends(get_db)):
     db_host.enabled = not db_host.enabled
     db_host.updated_at = datetime.utcnow()
     db.commit()
+    invalidate_hosts_cache()
+    drain_pools()
     
     status = "enabled" if db_host.enabled else "disabled"
     logger.info(f"Host '{db_host.label}' {status}")
@@ -1237,6 +1465,8 @@ async def delete_host(host_id: str, db: Session = Depends(get_db)):
         label = db_host.label
         db.delete(db_host)
         db.commit()
+        invalidate_hosts_cache()
+        drain_pools()
         logger.info(f"Deleted host: {label}")
     
     return RedirectResponse(url="/hosts", status_code=302)
@@ -2,7 +2,9 @@
 
 import re
 import json
-from typing import Dict, List, Any, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 
 # Pre-compiled regex patterns for performance (compiled once at module load)
 _RE_TIMESTAMP = re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
@@ -16,51 +18,230 @@ _RE_HISTORY_LIST = re.compile(r"History list length (\d+)")
 _RE_WAIT_SEC = re.compile(r"(\d+) sec")
 
 
+def _compile_alternation(patterns: Dict[str, str]) -> Tuple["re.Pattern[str]", Dict[str, Tuple[int, int]]]:
+    """
+    Combine several patterns into one named alternation, so a section is scanned once.
+    
+    Returns the compiled pattern and, per name, the (first, last+1) group numbers of
+    that pattern's own capture groups inside the combined pattern.
+    """
+    parts = []
+    spans = {}
+    group = 0
+    for name, pattern in patterns.items():
+        group += 1  # the named wrapper group
+        count = re.compile(pattern).groups
+        spans[name] = (group + 1, group + 1 + count)
+        group += count
+        parts.append(f"(?P<{name}>{pattern})")
+    return re.compile("|".join(parts)), spans
+
+
+def _first_matches(alternation: Tuple["re.Pattern[str]", Dict[str, Tuple[int, int]]], text: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Scan text once with a _compile_alternation() pattern.
+    
+    Returns each alternative's capture groups from its first match, like a
+    separate re.search() per pattern would (alternatives here never overlap).
+    """
+    pattern, spans = alternation
+    found: Dict[str, Tuple[str, ...]] = {}
+    for match in pattern.finditer(text):
+        name = match.lastgroup
+        if name not in found:
+            first, stop = spans[name]
+            found[name] = match.group(*range(first, stop)) if stop - first > 1 else (match.group(first),)
+            if len(found) == len(spans):
+                break
+    return found
+
+
+# InnoDB header / background thread
+_RE_HEADER_TIMESTAMP = re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?INNODB MONITOR OUTPUT")
+_RE_AVG_INTERVAL = re.compile(r"Per second averages calculated from the last (\d+) seconds")
+_RE_SRV_MASTER_LOOPS = re.compile(r"srv_master_thread loops: (\d+) srv_active, (\d+) srv_shutdown, (\d+) srv_idle")
+
+# SEMAPHORES
+_RE_OS_WAIT_RESERVATIONS = re.compile(r"OS WAIT ARRAY INFO: reservation count (\d+)")
+_RE_SIGNAL_COUNT = re.compile(r"signal count (\d+)")
+_RE_RW_SHARED = re.compile(r"RW-shared spins (\d+), rounds (\d+), OS waits (\d+)")
+_RE_RW_EXCL = re.compile(r"RW-excl spins (\d+), rounds (\d+), OS waits (\d+)")
+_RE_RW_SX = re.compile(r"RW-sx spins (\d+), rounds (\d+), OS waits (\d+)")
+_RE_SPIN_ROUNDS = re.compile(r"Spin rounds per wait: ([\d.]+) RW-shared, ([\d.]+) RW-excl, ([\d.]+) RW-sx")
+
+# TRANSACTIONS
+_RE_TRANSACTIONS = _compile_alternation({
+    "trx_id_counter": r"Trx id counter (\d+)",
+    "purge_trx_id": r"Purge done for trx's n:o < (\d+)",
+    "history_list_length": _RE_HISTORY_LIST.pattern,
+})
+
+# FILE I/O
+_RE_FILE_IO = _compile_alternation({
+    "os_file_reads": r"(\d+) OS file reads",
+    "os_file_writes": r"(\d+) OS file writes",
+    "os_fsyncs": r"(\d+) OS fsyncs",
+    "reads_per_sec": r"([\d.]+) reads/s",
+    "writes_per_sec": r"([\d.]+) writes/s",
+    "fsyncs_per_sec": r"([\d.]+) fsyncs/s",
+})
+_RE_IO_THREAD_STATE = re.compile(r"I/O thread \d+ state: (.*?) \((.*?)\)")
+
+# INSERT BUFFER AND ADAPTIVE HASH INDEX
+_RE_IBUF = re.compile(r"Ibuf: size (\d+), free list len (\d+), seg size (\d+), (\d+) merges")
+_RE_HASH_TABLE = re.compile(r"Hash table size (\d+), node heap has (\d+) buffer")
+_RE_HASH_SEARCHES = re.compile(r"([\d.]+) hash searches/s, ([\d.]+) non-hash searches/s")
+
+# LOG
+_RE_LOG = _compile_alternation({
+    "log_sequence_number": r"Log sequence number\s+(\d+)",
+    "log_flushed_up_to": r"Log flushed up to\s+(\d+)",
+    "last_checkpoint": r"Last checkpoint at\s+(\d+)",
+    "log_ios_done": r"(\d+) log i/o's done",
+    "log_ios_per_sec": r"([\d.]+) log i/o's/second",
+})
+
+# BUFFER POOL AND MEMORY
+_RE_BUFFER_POOL = _compile_alternation({
+    "pool_size": r"Buffer pool size\s+(\d+)",
+    "free_buffers": r"Free buffers\s+(\d+)",
+    "database_pages": r"Database pages\s+(\d+)",
+    "modified_pages": r"Modified db pages\s+(\d+)",
+    "pending_reads": r"Pending reads\s+(\d+)",
+    "hit_rate": r"Buffer pool hit rate (\d+) / (\d+)",
+    "pages_read": r"Pages read (\d+), created (\d+), written (\d+)",
+    "pages_made_young": r"Pages made young (\d+), not young (\d+)",
+})
+
+# ROW OPERATIONS
+_RE_ROW_OPERATIONS = _compile_alternation({
+    "queries": r"(\d+) queries inside InnoDB, (\d+) queries in queue",
+    "read_views": r"(\d+) read views open inside InnoDB",
+    "rows_total": r"Number of rows inserted (\d+), updated (\d+), deleted (\d+), read (\d+)",
+    "rows_per_sec": r"([\d.]+) inserts/s, ([\d.]+) updates/s, ([\d.]+) deletes/s, ([\d.]+) reads/s",
+})
+
+# LATEST DETECTED DEADLOCK
+_RE_DEADLOCK_TRX_SPLIT = re.compile(r'\*\*\* \(\d+\) TRANSACTION:')
+_RE_DEADLOCK_QUERY = re.compile(
+    r"(?:^|\n)((?:INSERT|UPDATE|DELETE|SELECT|REPLACE)\s+(?:INTO\s+)?[`\w].*?)(?:\n\*\*\*|\nRECORD LOCKS|\n---|\n$|$)",
+    re.IGNORECASE | re.DOTALL
+)
+_RE_QUERY_TABLE = re.compile(r"(?:INTO|FROM|UPDATE)\s+(\w+)", re.IGNORECASE)
+_RE_LOCK_MODE = re.compile(r"(RECORD LOCKS|GAP|X|S) lock", re.IGNORECASE)
+_RE_ROLLBACK_VICTIM = re.compile(r"WE ROLL BACK TRANSACTION \((\d+)\)")
+_RE_LEADING_NUMBER = re.compile(r"\s*(\d+)")
+
+# Locating the InnoDB monitor text inside a combined raw.txt (tried in order)
+_RE_INNODB_BANNER = re.compile(r"-- SHOW ENGINE INNODB STATUS.*?={60}\n(.*?)(?=\n={60}|$)", re.DOTALL)
+_RE_INNODB_TABULAR = re.compile(r"Type\tName\tStatus\n\w+\t\w*\t(.*?)(?=\n={60}|$)", re.DOTALL)
+# The monitor's own begin/end markers are located with str.find (see _extract_innodb_text)
+_MONITOR_RULE = "=" * 37 + "\n"
+_MONITOR_BEGIN = "INNODB MONITOR OUTPUT"
+_MONITOR_END = "END OF INNODB MONITOR OUTPUT"
+
+# Known InnoDB monitor sections, in output order
+_INNODB_SECTIONS = [
+    "BACKGROUND THREAD",
+    "SEMAPHORES",
+    "LATEST FOREIGN KEY ERROR",
+    "LATEST DETECTED DEADLOCK",
+    "TRANSACTIONS",
+    "FILE I/O",
+    "INSERT BUFFER AND ADAPTIVE HASH INDEX",
+    "LOG",
+    "BUFFER POOL AND MEMORY",
+    "INDIVIDUAL BUFFER POOL INFO",
+    "ROW OPERATIONS",
+]
+# A section header: the section name between two lines of dashes
+_RE_INNODB_SECTION_HEADER = re.compile(r"-{3,}\n([A-Z][A-Z /]+)\n-{3,}\n")
+
+
 def parse_innodb_status(raw_output: str) -> str:
     """
     Extract InnoDB status section from raw output.
     Returns formatted, readable sections.
     """
-    # Look for the INNODB STATUS section marker
-    innodb_section = ""
+    innodb_section = _extract_innodb_text(raw_output)
     
-    # Find section between the command header and the next section or end
-    section_pattern = r"-- SHOW ENGINE INNODB STATUS.*?={60}\n(.*?)(?=\n={60}|$)"
-    match = re.search(section_pattern, raw_output, re.DOTALL)
+    if innodb_section:
+        return format_innodb_status(innodb_section)
     
-    if match:
-        innodb_section = match.group(1).strip()
+    # Return raw output if we can't parse it
+    return raw_output if raw_output else "InnoDB status not found in output."
+
+
+@lru_cache(maxsize=8)
+def _unescape_newlines(text: str) -> str:
+    """
+    Convert literal \\n to real newlines (MySQL tabular format stores them escaped).
     
-    # If not found with header, try to find InnoDB monitor output directly
-    if not innodb_section:
-        # Look for the InnoDB status output (starts after Type/Name/Status headers)
-        pattern = r"Type\tName\tStatus\n\w+\t\w*\t(.*?)(?=\n={60}|$)"
-        match = re.search(pattern, raw_output, re.DOTALL)
+    Memoized because analyze_innodb_health hands the same output to five parsers,
+    each of which normalizes it; after the first, the lookup is a hash hit.
+    """
+    if '\\n' in text:
+        return text.replace('\\n', '\n')
+    return text
+
+
+@lru_cache(maxsize=8)
+def _extract_innodb_text(raw_output: str) -> str:
+    """
+    Locate the InnoDB monitor text inside a combined raw output.
+    
+    Tries our "-- SHOW ENGINE INNODB STATUS" banner, then the tabular
+    Type/Name/Status format, then the monitor's own begin/end markers.
+    Memoized so parse_innodb_status and parse_innodb_status_structured
+    on the same output only search it once.
+    """
+    # Cheap substring checks skip patterns that cannot match
+    if "-- SHOW ENGINE INNODB STATUS" in raw_output:
+        match = _RE_INNODB_BANNER.search(raw_output)
         if match:
-            innodb_section = match.group(1).strip()
+            innodb_text = match.group(1).strip()
+            if innodb_text:
+                return innodb_text
     
-    # If still not found, look for InnoDB monitor markers
-    if not innodb_section:
-        pattern = r"=====================================\n.*?INNODB MONITOR OUTPUT.*?END OF INNODB MONITOR OUTPUT"
-        match = re.search(pattern, raw_output, re.DOTALL)
+    if "Type\tName\tStatus\n" in raw_output:
+        match = _RE_INNODB_TABULAR.search(raw_output)
         if match:
-            innodb_section = match.group(0)
+            innodb_text = match.group(1).strip()
+            if innodb_text:
+                return innodb_text
+    
+    # Same span as the DOTALL pattern "={37}\n.*?INNODB MONITOR OUTPUT.*?END OF INNODB
+    # MONITOR OUTPUT": the earliest rule line, then the first begin and end markers after it
+    start = raw_output.find(_MONITOR_RULE)
+    if start != -1:
+        begin = raw_output.find(_MONITOR_BEGIN, start + len(_MONITOR_RULE))
+        if begin != -1:
+            end = raw_output.find(_MONITOR_END, begin + len(_MONITOR_BEGIN))
+            if end != -1:
+                return raw_output[start:end + len(_MONITOR_END)]
+    
+    return ""
+
+
+def format_innodb_status(innodb_text: str) -> str:
+    """
+    Format the text of a single SHOW ENGINE INNODB STATUS result into readable sections.
     
+    Unlike parse_innodb_status, this takes the InnoDB monitor text itself and does not
+    search a combined raw.txt for it.
+    """
     # Handle literal \n in the output (MySQL tabular format stores newlines as literal \n)
-    if innodb_section and '\\n' in innodb_section:
-        innodb_section = innodb_section.replace('\\n', '\n')
+    innodb_text = _unescape_newlines(innodb_text)
     
-    if innodb_section:
-        return _format_innodb_sections(innodb_section)
-    
-    # Return raw output if we can't parse it
-    return raw_output if raw_output else "InnoDB status not found in output."
+    return _format_innodb_sections(innodb_text)
 
 
-def parse_innodb_status_structured(raw_output: str) -> Dict[str, Any]:
+def parse_innodb_status_structured(raw_output: str, include_raw: bool = False) -> Dict[str, Any]:
     """
     Parse InnoDB status into structured data for UI display.
     Returns a dictionary with parsed sections and key metrics.
+    
+    raw_sections (each parsed section's text) is only filled in when include_raw is set.
     """
     result = {
         "header": {},
@@ -76,45 +257,31 @@ def parse_innodb_status_structured(raw_output: str) -> Dict[str, Any]:
     }
     
     # Extract InnoDB section
-    innodb_text = ""
-    section_pattern = r"-- SHOW ENGINE INNODB STATUS.*?={60}\n(.*?)(?=\n={60}|$)"
-    match = re.search(section_pattern, raw_output, re.DOTALL)
-    if match:
-        innodb_text = match.group(1).strip()
-    
-    if not innodb_text:
-        pattern = r"Type\tName\tStatus\n\w+\t\w*\t(.*?)(?=\n={60}|$)"
-        match = re.search(pattern, raw_output, re.DOTALL)
-        if match:
-            innodb_text = match.group(1).strip()
-    
-    if not innodb_text:
-        pattern = r"=====================================\n.*?INNODB MONITOR OUTPUT.*?END OF INNODB MONITOR OUTPUT"
-        match = re.search(pattern, raw_output, re.DOTALL)
-        if match:
-            innodb_text = match.group(0)
+    innodb_text = _extract_innodb_text(raw_output)
     
     # Handle literal \n in the output (MySQL tabular format stores newlines as literal \n)
-    if '\\n' in innodb_text:
-        innodb_text = innodb_text.replace('\\n', '\n')
+    innodb_text = _unescape_newlines(innodb_text)
     
     if not innodb_text:
         return result
     
+    sections = _split_sections(innodb_text)
+    
     # Parse header
-    header_match = re.search(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?INNODB MONITOR OUTPUT", innodb_text)
+    header_match = _RE_HEADER_TIMESTAMP.search(innodb_text)
     if header_match:
         result["header"]["timestamp"] = header_match.group(1)
     
-    avg_match = re.search(r"Per second averages calculated from the last (\d+) seconds", innodb_text)
+    avg_match = _RE_AVG_INTERVAL.search(innodb_text)
     if avg_match:
         result["header"]["avg_interval"] = int(avg_match.group(1))
     
     # Parse Background Thread
-    bg_section = _extract_section(innodb_text, "BACKGROUND THREAD")
+    bg_section = _section_content(sections, "BACKGROUND THREAD")
     if bg_section:
-        result["raw_sections"]["background_thread"] = bg_section
-        master_match = re.search(r"srv_master_thread loops: (\d+) srv_active, (\d+) srv_shutdown, (\d+) srv_idle", bg_section)
+        if include_raw:
+            result["raw_sections"]["background_thread"] = bg_section
+        master_match = _RE_SRV_MASTER_LOOPS.search(bg_section)
         if master_match:
             result["background_thread"] = {
                 "srv_active": int(master_match.group(1)),
@@ -123,17 +290,18 @@ def parse_innodb_status_structured(raw_output: str) -> Dict[str, Any]:
             }
     
     # Parse Semaphores
-    sem_section = _extract_section(innodb_text, "SEMAPHORES")
+    sem_section = _section_content(sections, "SEMAPHORES")
     if sem_section:
-        result["raw_sections"]["semaphores"] = sem_section
-        os_wait = re.findall(r"OS WAIT ARRAY INFO: reservation count (\d+)", sem_section)
-        signal_match = re.search(r"signal count (\d+)", sem_section)
+        if include_raw:
+            result["raw_sections"]["semaphores"] = sem_section
+        os_wait = _RE_OS_WAIT_RESERVATIONS.findall(sem_section)
+        signal_match = _RE_SIGNAL_COUNT.search(sem_section)
         result["semaphores"] = {
             "os_waits": [int(w) for w in os_wait] if os_wait else [],
             "signal_count": int(signal_match.group(1)) if signal_match else 0,
         }
         
-        rw_shared = re.search(r"RW-shared spins (\d+), rounds (\d+), OS waits (\d+)", sem_section)
+        rw_shared = _RE_RW_SHARED.search(sem_section)
         if rw_shared:
             result["semaphores"]["rw_shared"] = {
                 "spins": int(rw_shared.group(1)),
@@ -142,61 +310,62 @@ def parse_innodb_status_structured(raw_output: str) -> Dict[str, Any]:
             }
     
     # Parse Transactions
-    trx_section = _extract_section(innodb_text, "TRANSACTIONS")
+    trx_section = _section_content(sections, "TRANSACTIONS")
     if trx_section:
-        result["raw_sections"]["transactions"] = trx_section
-        trx_id = re.search(r"Trx id counter (\d+)", trx_section)
-        purge_match = re.search(r"Purge done for trx's n:o < (\d+)", trx_section)
-        history_match = re.search(r"History list length (\d+)", trx_section)
+        if include_raw:
+            result["raw_sections"]["transactions"] = trx_section
+        trx = _first_matches(_RE_TRANSACTIONS, trx_section)
         
-        active_trx = re.findall(r"---TRANSACTION (\d+)", trx_section)
-        not_started = len(re.findall(r"not started", trx_section))
+        # Plain substring counts; the matches themselves are never used
+        total_trx = trx_section.count("---TRANSACTION ")
+        not_started = trx_section.count("not started")
         
         result["transactions"] = {
-            "trx_id_counter": int(trx_id.group(1)) if trx_id else 0,
-            "purge_trx_id": int(purge_match.group(1)) if purge_match else 0,
-            "history_list_length": int(history_match.group(1)) if history_match else 0,
-            "total_transactions": len(active_trx),
+            "trx_id_counter": int(trx["trx_id_counter"][0]) if "trx_id_counter" in trx else 0,
+            "purge_trx_id": int(trx["purge_trx_id"][0]) if "purge_trx_id" in trx else 0,
+            "history_list_length": int(trx["history_list_length"][0]) if "history_list_length" in trx else 0,
+            "total_transactions": total_trx,
             "not_started": not_started,
-            "active": len(active_trx) - not_started,
+            "active": total_trx - not_started,
         }
     
     # Parse File I/O
-    io_section = _extract_section(innodb_text, "FILE I/O")
+    io_section = _section_content(sections, "FILE I/O")
     if io_section:
-        result["raw_sections"]["file_io"] = io_section
-        reads_match = re.search(r"(\d+) OS file reads", io_section)
-        writes_match = re.search(r"(\d+) OS file writes", io_section)
-        fsyncs_match = re.search(r"(\d+) OS fsyncs", io_section)
-        
-        reads_s = re.search(r"([\d.]+) reads/s", io_section)
-        writes_s = re.search(r"([\d.]+) writes/s", io_section)
-        fsyncs_s = re.search(r"([\d.]+) fsyncs/s", io_section)
-        
-        pending_reads = re.search(r"Pending normal aio reads: \[([\d, ]+)\]", io_section)
-        pending_writes = re.search(r"aio writes: \[([\d, ]+)\]", io_section)
-        
-        io_threads = re.findall(r"I/O thread \d+ state: (.*?) \((.*?)\)", io_section)
+        if include_raw:
+            result["raw_sections"]["file_io"] = io_section
+        io = _first_matches(_RE_FILE_IO, io_section)
+        # One pass over the I/O thread lines; the two counts are independent
+        # ("read" also matches the "thread" in every thread type)
+        io_threads_count = read_threads = write_threads = 0
+        for thread_match in _RE_IO_THREAD_STATE.finditer(io_section):
+            io_threads_count += 1
+            thread_type = thread_match.group(2)
+            if "read" in thread_type:
+                read_threads += 1
+            if "write" in thread_type:
+                write_threads += 1
         
         result["file_io"] = {
-            "os_file_reads": int(reads_match.group(1)) if reads_match else 0,
-            "os_file_writes": int(writes_match.group(1)) if writes_match else 0,
-            "os_fsyncs": int(fsyncs_match.group(1)) if fsyncs_match else 0,
-            "reads_per_sec": float(reads_s.group(1)) if reads_s else 0,
-            "writes_per_sec": float(writes_s.group(1)) if writes_s else 0,
-            "fsyncs_per_sec": float(fsyncs_s.group(1)) if fsyncs_s else 0,
-            "io_threads_count": len(io_threads),
-            "read_threads": len([t for t in io_threads if "read" in t[1]]),
-            "write_threads": len([t for t in io_threads if "write" in t[1]]),
+            "os_file_reads": int(io["os_file_reads"][0]) if "os_file_reads" in io else 0,
+            "os_file_writes": int(io["os_file_writes"][0]) if "os_file_writes" in io else 0,
+            "os_fsyncs": int(io["os_fsyncs"][0]) if "os_fsyncs" in io else 0,
+            "reads_per_sec": float(io["reads_per_sec"][0]) if "reads_per_sec" in io else 0,
+            "writes_per_sec": float(io["writes_per_sec"][0]) if "writes_per_sec" in io else 0,
+            "fsyncs_per_sec": float(io["fsyncs_per_sec"][0]) if "fsyncs_per_sec" in io else 0,
+            "io_threads_count": io_threads_count,
+            "read_threads": read_threads,
+            "write_threads": write_threads,
         }
     
     # Parse Insert Buffer and Adaptive Hash Index
-    ibuf_section = _extract_section(innodb_text, "INSERT BUFFER AND ADAPTIVE HASH INDEX")
+    ibuf_section = _section_content(sections, "INSERT BUFFER AND ADAPTIVE HASH INDEX")
     if ibuf_section:
-        result["raw_sections"]["insert_buffer"] = ibuf_section
-        ibuf_match = re.search(r"Ibuf: size (\d+), free list len (\d+), seg size (\d+), (\d+) merges", ibuf_section)
-        hash_table = re.findall(r"Hash table size (\d+), node heap has (\d+) buffer", ibuf_section)
-        hash_search = re.search(r"([\d.]+) hash searches/s, ([\d.]+) non-hash searches/s", ibuf_section)
+        if include_raw:
+            result["raw_sections"]["insert_buffer"] = ibuf_section
+        ibuf_match = _RE_IBUF.search(ibuf_section)
+        hash_table = _RE_HASH_TABLE.findall(ibuf_section)
+        hash_search = _RE_HASH_SEARCHES.search(ibuf_section)
         
         result["insert_buffer"] = {
             "ibuf_size": int(ibuf_match.group(1)) if ibuf_match else 0,
@@ -210,19 +379,17 @@ def parse_innodb_status_structured(raw_output: str) -> Dict[str, Any]:
         }
     
     # Parse Log
-    log_section = _extract_section(innodb_text, "LOG")
+    log_section = _section_content(sections, "LOG")
     if log_section:
-        result["raw_sections"]["log"] = log_section
-        lsn = re.search(r"Log sequence number\s+(\d+)", log_section)
-        flushed = re.search(r"Log flushed up to\s+(\d+)", log_section)
-        checkpoint = re.search(r"Last checkpoint at\s+(\d+)", log_section)
-        log_ios = re.search(r"(\d+) log i/o's done", log_section)
+        if include_raw:
+            result["raw_sections"]["log"] = log_section
+        log = _first_matches(_RE_LOG, log_section)
         
         result["log"] = {
-            "log_sequence_number": int(lsn.group(1)) if lsn else 0,
-            "log_flushed_up_to": int(flushed.group(1)) if flushed else 0,
-            "last_checkpoint": int(checkpoint.group(1)) if checkpoint else 0,
-            "log_ios_done": int(log_ios.group(1)) if log_ios else 0,
+            "log_sequence_number": int(log["log_sequence_number"][0]) if "log_sequence_number" in log else 0,
+            "log_flushed_up_to": int(log["log_flushed_up_to"][0]) if "log_flushed_up_to" in log else 0,
+            "last_checkpoint": int(log["last_checkpoint"][0]) if "last_checkpoint" in log else 0,
+            "log_ios_done": int(log["log_ios_done"][0]) if "log_ios_done" in log else 0,
         }
         
         # Calculate checkpoint age
@@ -230,32 +397,28 @@ def parse_innodb_status_structured(raw_output: str) -> Dict[str, Any]:
             result["log"]["checkpoint_age"] = result["log"]["log_sequence_number"] - result["log"]["last_checkpoint"]
     
     # Parse Buffer Pool and Memory
-    bp_section = _extract_section(innodb_text, "BUFFER POOL AND MEMORY")
+    bp_section = _section_content(sections, "BUFFER POOL AND MEMORY")
     if bp_section:
-        result["raw_sections"]["buffer_pool"] = bp_section
-        pool_size = re.search(r"Buffer pool size\s+(\d+)", bp_section)
-        free_buffers = re.search(r"Free buffers\s+(\d+)", bp_section)
-        db_pages = re.search(r"Database pages\s+(\d+)", bp_section)
-        modified = re.search(r"Modified db pages\s+(\d+)", bp_section)
-        pending_reads = re.search(r"Pending reads\s+(\d+)", bp_section)
-        hit_rate = re.search(r"Buffer pool hit rate (\d+) / (\d+)", bp_section)
-        
-        pages_read = re.search(r"Pages read (\d+), created (\d+), written (\d+)", bp_section)
-        pages_made_young = re.search(r"Pages made young (\d+), not young (\d+)", bp_section)
+        if include_raw:
+            result["raw_sections"]["buffer_pool"] = bp_section
+        bp = _first_matches(_RE_BUFFER_POOL, bp_section)
+        hit_rate = bp.get("hit_rate")
+        pages_read = bp.get("pages_read")
+        pages_made_young = bp.get("pages_made_young")
         
         result["buffer_pool"] = {
-            "pool_size": int(pool_size.group(1)) if pool_size else 0,
-            "free_buffers": int(free_buffers.group(1)) if free_buffers else 0,
-            "database_pages": int(db_pages.group(1)) if db_pages else 0,
-            "modified_pages": int(modified.group(1)) if modified else 0,
-            "pending_reads": int(pending_reads.group(1)) if pending_reads else 0,
-            "hit_rate_num": int(hit_rate.group(1)) if hit_rate else 0,
-            "hit_rate_denom": int(hit_rate.group(2)) if hit_rate else 1000,
-            "pages_read": int(pages_read.group(1)) if pages_read else 0,
-            "pages_created": int(pages_read.group(2)) if pages_read else 0,
-            "pages_written": int(pages_read.group(3)) if pages_read else 0,
-            "pages_made_young": int(pages_made_young.group(1)) if pages_made_young else 0,
-            "pages_not_made_young": int(pages_made_young.group(2)) if pages_made_young else 0,
+            "pool_size": int(bp["pool_size"][0]) if "pool_size" in bp else 0,
+            "free_buffers": int(bp["free_buffers"][0]) if "free_buffers" in bp else 0,
+            "database_pages": int(bp["database_pages"][0]) if "database_pages" in bp else 0,
+            "modified_pages": int(bp["modified_pages"][0]) if "modified_pages" in bp else 0,
+            "pending_reads": int(bp["pending_reads"][0]) if "pending_reads" in bp else 0,
+            "hit_rate_num": int(hit_rate[0]) if hit_rate else 0,
+            "hit_rate_denom": int(hit_rate[1]) if hit_rate else 1000,
+            "pages_read": int(pages_read[0]) if pages_read else 0,
+            "pages_created": int(pages_read[1]) if pages_read else 0,
+            "pages_written": int(pages_read[2]) if pages_read else 0,
+            "pages_made_young": int(pages_made_young[0]) if pages_made_young else 0,
+            "pages_not_made_young": int(pages_made_young[1]) if pages_made_young else 0,
         }
         
         # Calculate utilization
@@ -268,37 +431,68 @@ def parse_innodb_status_structured(raw_output: str) -> Dict[str, Any]:
             )
     
     # Parse Row Operations
-    row_section = _extract_section(innodb_text, "ROW OPERATIONS")
+    row_section = _section_content(sections, "ROW OPERATIONS")
     if row_section:
-        result["raw_sections"]["row_operations"] = row_section
-        queries = re.search(r"(\d+) queries inside InnoDB, (\d+) queries in queue", row_section)
-        read_views = re.search(r"(\d+) read views open inside InnoDB", row_section)
-        
-        rows_total = re.search(r"Number of rows inserted (\d+), updated (\d+), deleted (\d+), read (\d+)", row_section)
-        rows_per_sec = re.search(r"([\d.]+) inserts/s, ([\d.]+) updates/s, ([\d.]+) deletes/s, ([\d.]+) reads/s", row_section)
+        if include_raw:
+            result["raw_sections"]["row_operations"] = row_section
+        rows = _first_matches(_RE_ROW_OPERATIONS, row_section)
+        queries = rows.get("queries")
+        read_views = rows.get("read_views")
+        rows_total = rows.get("rows_total")
+        rows_per_sec = rows.get("rows_per_sec")
         
         result["row_operations"] = {
-            "queries_inside": int(queries.group(1)) if queries else 0,
-            "queries_in_queue": int(queries.group(2)) if queries else 0,
-            "read_views_open": int(read_views.group(1)) if read_views else 0,
-            "rows_inserted": int(rows_total.group(1)) if rows_total else 0,
-            "rows_updated": int(rows_total.group(2)) if rows_total else 0,
-            "rows_deleted": int(rows_total.group(3)) if rows_total else 0,
-            "rows_read": int(rows_total.group(4)) if rows_total else 0,
-            "inserts_per_sec": float(rows_per_sec.group(1)) if rows_per_sec else 0,
-            "updates_per_sec": float(rows_per_sec.group(2)) if rows_per_sec else 0,
-            "deletes_per_sec": float(rows_per_sec.group(3)) if rows_per_sec else 0,
-            "reads_per_sec": float(rows_per_sec.group(4)) if rows_per_sec else 0,
+            "queries_inside": int(queries[0]) if queries else 0,
+            "queries_in_queue": int(queries[1]) if queries else 0,
+            "read_views_open": int(read_views[0]) if read_views else 0,
+            "rows_inserted": int(rows_total[0]) if rows_total else 0,
+            "rows_updated": int(rows_total[1]) if rows_total else 0,
+            "rows_deleted": int(rows_total[2]) if rows_total else 0,
+            "rows_read": int(rows_total[3]) if rows_total else 0,
+            "inserts_per_sec": float(rows_per_sec[0]) if rows_per_sec else 0,
+            "updates_per_sec": float(rows_per_sec[1]) if rows_per_sec else 0,
+            "deletes_per_sec": float(rows_per_sec[2]) if rows_per_sec else 0,
+            "reads_per_sec": float(rows_per_sec[3]) if rows_per_sec else 0,
         }
     
     return result
 
 
+@lru_cache(maxsize=8)
+def _split_sections(innodb_text: str) -> Dict[str, str]:
+    """
+    Split InnoDB status text into {section_name: body} in a single pass.
+    
+    Bodies run up to the next section header; if a name repeats, the first wins.
+    The result is memoized and shared between callers, so treat it as read-only.
+    """
+    parts = _RE_INNODB_SECTION_HEADER.split(innodb_text)
+    sections: Dict[str, str] = {}
+    for name, body in zip(parts[1::2], parts[2::2]):
+        sections.setdefault(name, body)
+    return sections
+
+
+def _section_content(sections: Dict[str, str], section_name: str) -> Optional[str]:
+    """
+    Return a section's content from _split_sections(), trimmed like _extract_section().
+    """
+    body = sections.get(section_name)
+    if body is None:
+        return None
+    # Content ends at the first "---" line past the first few characters
+    end_idx = body.find('\n---', 11)
+    section_content = (body if end_idx == -1 else body[:end_idx]).strip()
+    return section_content if section_content else None
+
+
+@lru_cache(maxsize=32)
 def _extract_section(innodb_text: str, section_name: str) -> Optional[str]:
     """
     Extract a specific section from InnoDB status text.
     
-    OPTIMIZED: Uses string find() instead of regex with .*? DOTALL.
+    OPTIMIZED: Uses string find() instead of regex with .*? DOTALL, and is
+    memoized since the health parsers extract the same sections from one output.
     """
     # Find section header (format: "---\nSECTION_NAME\n---")
     section_markers = [
@@ -345,50 +539,32 @@ def _extract_section(innodb_text: str, section_name: str) -> Optional[str]:
 
 def _format_innodb_sections(innodb_text: str) -> str:
     """Format InnoDB status into readable sections."""
-    # Define known section headers
-    sections = [
-        "BACKGROUND THREAD",
-        "SEMAPHORES",
-        "LATEST FOREIGN KEY ERROR",
-        "LATEST DETECTED DEADLOCK",
-        "TRANSACTIONS",
-        "FILE I/O",
-        "INSERT BUFFER AND ADAPTIVE HASH INDEX",
-        "LOG",
-        "BUFFER POOL AND MEMORY",
-        "INDIVIDUAL BUFFER POOL INFO",
-        "ROW OPERATIONS",
-    ]
-    
     formatted = []
     formatted.append("=" * 60)
     formatted.append("INNODB ENGINE STATUS")
     formatted.append("=" * 60)
     formatted.append("")
     
-    # Check if we have section markers in the text
-    has_sections = any(section in innodb_text for section in sections)
-    
-    if has_sections:
-        # Extract each section
-        for section in sections:
-            pattern = rf"-+\n{section}\n-+\n(.*?)(?=-{{5,}}|\Z)"
-            match = re.search(pattern, innodb_text, re.DOTALL)
-            if match:
-                formatted.append(f"### {section}")
-                formatted.append("-" * 40)
-                content = match.group(1).strip()
-                if content:
-                    formatted.append(content)
-                else:
-                    formatted.append("(empty)")
-                formatted.append("")
-        
-        return "\n".join(formatted) if len(formatted) > 4 else innodb_text
-    else:
-        # Return raw text with header
-        formatted.append(innodb_text)
+    # One split finds every section header; known sections keep their canonical order
+    sections = _split_sections(innodb_text)
+    for section in _INNODB_SECTIONS:
+        body = sections.get(section)
+        if body is not None:
+            # A section's content stops at the next run of dashes
+            end_idx = body.find("-----")
+            content = (body if end_idx == -1 else body[:end_idx]).strip()
+            formatted.extend((f"### {section}", "-" * 40, content or "(empty)", ""))
+    
+    if len(formatted) > 4:
         return "\n".join(formatted)
+    
+    # Section names without headers: leave the text as-is
+    if any(section in innodb_text for section in _INNODB_SECTIONS):
+        return innodb_text
+    
+    # Return raw text with header
+    formatted.append(innodb_text)
+    return "\n".join(formatted)
 
 
 def parse_global_status(result_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -411,20 +587,29 @@ def parse_global_status(result_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
             if not var_name:
                 continue
             
-            # Try to convert to number
-            try:
-                if isinstance(value, (int, float)):
-                    result[var_name] = value
-                elif "." in str(value):
-                    result[var_name] = float(value)
-                else:
-                    result[var_name] = int(value)
-            except (ValueError, TypeError):
-                result[var_name] = value
+            # Status values arrive as strings and are mostly integers: try int()
+            # first, then float() for values with a "."; anything else (including
+            # values that are already numbers) is kept as-is
+            if type(value) is str:
+                try:
+                    value = int(value)
+                except ValueError:
+                    if "." in value:
+                        try:
+                            value = float(value)
+                        except ValueError:
+                            pass
+            result[var_name] = value
     
     return result
 
 
+# SHOW FULL PROCESSLIST columns we keep (lowercased)
+_PROCESSLIST_FIELDS = frozenset(["id", "user", "host", "db", "command", "time", "state", "info"])
+# Values that mean NULL in processlist output
+_PROCESSLIST_NULLS = frozenset(["NULL", "\\N"])
+
+
 def parse_processlist(result_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Parse SHOW FULL PROCESSLIST output into list of dictionaries.
@@ -435,17 +620,24 @@ def parse_processlist(result_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     Returns:
         List of process dictionaries
     """
-    processes = []
+    return list(iter_processlist(result_rows))
+
+
+def iter_processlist(result_rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse SHOW FULL PROCESSLIST rows one at a time (see parse_processlist).
     
+    Lets a caller that only filters the rows avoid building the full list.
+    """
     for row in result_rows:
         if isinstance(row, dict):
             process = {}
             # Map column names to lowercase field names
             for key, value in row.items():
                 field_name = key.lower()
-                if field_name in ["id", "user", "host", "db", "command", "time", "state", "info"]:
+                if field_name in _PROCESSLIST_FIELDS:
                     # Handle NULL values
-                    if value is None or value == "NULL" or value == "\\N":
+                    if value is None or (type(value) is str and value in _PROCESSLIST_NULLS):
                         process[field_name] = None
                     # Convert numeric fields
                     elif field_name == "time":
@@ -462,16 +654,18 @@ def parse_processlist(result_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]
                         process[field_name] = value
             
             if process:
-                processes.append(process)
-    
-    return processes
+                yield process
+
+
+@lru_cache(maxsize=32)
+def _command_section_re(command: str) -> "re.Pattern[str]":
+    """Compiled pattern for a command's output with our header format (one per command)."""
+    return re.compile(rf"-- {re.escape(command)}.*?={{60}}\n(.*?)(?=\n={{60}}|$)", re.DOTALL | re.IGNORECASE)
 
 
 def extract_section(raw_output: str, command: str) -> str:
     """Extract output for a specific command from the raw output."""
-    # Pattern to find command output with our header format
-    pattern = rf"-- {re.escape(command)}.*?={60}\n(.*?)(?=\n={60}|$)"
-    match = re.search(pattern, raw_output, re.DOTALL | re.IGNORECASE)
+    match = _command_section_re(command).search(raw_output)
     
     if match:
         return match.group(1).strip()
@@ -479,39 +673,71 @@ def extract_section(raw_output: str, command: str) -> str:
     return raw_output
 
 
+def _process_search_key(p: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Lowercased (user, state, info) of one process; missing or NULL fields become ""."""
+    return (
+        (p.get("user") or "").lower(),
+        (p.get("state") or "").lower(),
+        (p.get("info") or "").lower(),
+    )
+
+
+def processlist_search_keys(processes: List[Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+    """
+    Lowercased (user, state, info) for each process, for filter_processlist.
+    
+    Compute once per processlist and reuse across filter calls so rows are
+    not lowercased again on every filter.
+    """
+    return [_process_search_key(p) for p in processes]
+
+
 def filter_processlist(
-    processes: List[Dict[str, Any]],
+    processes: Iterable[Dict[str, Any]],
     user: Optional[str] = None,
     state: Optional[str] = None,
     min_time: Optional[int] = None,
-    query: Optional[str] = None
+    query: Optional[str] = None,
+    search_keys: Optional[List[Tuple[str, str, str]]] = None
 ) -> List[Dict[str, Any]]:
     """
     Filter processlist by criteria.
     
     Args:
-        processes: List of process dictionaries
+        processes: Process dictionaries (a list, or e.g. iter_processlist())
         user: Filter by user name (case-insensitive substring)
         state: Filter by state (case-insensitive substring)
         min_time: Filter by minimum time in seconds
         query: Filter by query/info content (case-insensitive substring)
+        search_keys: processlist_search_keys(processes), if already computed
     
     Returns:
         Filtered list of processes
     """
-    result = processes
-    
-    if user:
-        result = [p for p in result if p.get("user") and user.lower() in p["user"].lower()]
-    
-    if state:
-        result = [p for p in result if p.get("state") and state.lower() in p["state"].lower()]
-    
-    if min_time is not None:
-        result = [p for p in result if p.get("time", 0) >= min_time]
-    
-    if query:
-        result = [p for p in result if p.get("info") and query.lower() in p["info"].lower()]
+    user = user.lower() if user else None
+    state = state.lower() if state else None
+    query = query.lower() if query else None
+    if not (user or state or query) and min_time is None:
+        return processes if isinstance(processes, list) else list(processes)
+    
+    if search_keys is not None:
+        rows = zip(processes, search_keys)
+    else:
+        rows = ((p, _process_search_key(p)) for p in processes)
+    
+    # Single pass, cheapest check first: the integer time comparison rejects
+    # rows before any substring search, and the query/info check (longest strings) runs last
+    result = []
+    for p, (user_lc, state_lc, info_lc) in rows:
+        if min_time is not None and p.get("time", 0) < min_time:
+            continue
+        if user and user not in user_lc:
+            continue
+        if state and state not in state_lc:
+            continue
+        if query and query not in info_lc:
+            continue
+        result.append(p)
     
     return result
 
@@ -565,8 +791,8 @@ def get_key_metrics(global_status: Dict[str, Any]) -> Dict[str, Any]:
     return metrics
 
 
-# Allowlist of important config variables to display
-CONFIG_VARIABLES_ALLOWLIST = [
+# Allowlist of important config variables to display, in display order
+CONFIG_VARIABLES_ALLOWLIST = (
     # Memory & Buffer Pool
     "innodb_buffer_pool_size",
     "innodb_buffer_pool_instances",
@@ -605,7 +831,10 @@ CONFIG_VARIABLES_ALLOWLIST = [
     "super_read_only",
     # Transaction
     "transaction_isolation",
-]
+)
+
+# Membership checks against the allowlist (the tuple keeps display order)
+CONFIG_VARIABLES_ALLOWLIST_SET = frozenset(CONFIG_VARIABLES_ALLOWLIST)
 
 
 def parse_config_variables(result_rows: List[Dict[str, Any]], filter_allowlist: bool = True) -> Dict[str, Any]:
@@ -619,22 +848,15 @@ def parse_config_variables(result_rows: List[Dict[str, Any]], filter_allowlist:
     Returns:
         Dictionary of variable_name -> value
     """
+    # Filter to allowlist if requested
+    allowlist = CONFIG_VARIABLES_ALLOWLIST_SET if filter_allowlist else None
     result = {}
     
     for row in result_rows:
         if isinstance(row, dict):
             var_name = row.get("Variable_name", "").lower()
-            value = row.get("Value", "")
-            
-            if not var_name:
-                continue
-            
-            # Filter to allowlist if requested
-            if filter_allowlist:
-                if var_name in CONFIG_VARIABLES_ALLOWLIST:
-                    result[var_name] = value
-            else:
-                result[var_name] = value
+            if var_name and (allowlist is None or var_name in allowlist):
+                result[var_name] = row.get("Value", "")
     
     return result
 
@@ -652,6 +874,218 @@ def parse_all_config_variables(result_rows: List[Dict[str, Any]]) -> Dict[str, A
     return parse_config_variables(result_rows, filter_allowlist=False)
 
 
+# Size thresholds used by evaluate_config_health
+_MB_16 = 16 << 20
+_MB_64 = 64 << 20
+_MB_128 = 128 << 20
+_MB_512 = 512 << 20
+
+# Inputs evaluate_config_health reads as integers
+_HEALTH_CONFIG_INT_KEYS = (
+    "innodb_buffer_pool_size",
+    "max_connections",
+    "tmp_table_size",
+    "max_heap_table_size",
+    "table_open_cache",
+    "table_definition_cache",
+    "open_files_limit",
+    "thread_cache_size",
+    "wait_timeout",
+    "innodb_log_file_size",
+    "innodb_flush_log_at_trx_commit",
+    "sync_binlog",
+    "innodb_read_io_threads",
+    "innodb_write_io_threads",
+)
+_HEALTH_STATUS_INT_KEYS = (
+    "Threads_connected",
+    "Open_tables",
+    "Opened_tables",
+    "Table_open_cache_overflows",
+    "Open_table_definitions",
+)
+
+
+# Table-driven checks for evaluate_config_health:
+# (variable, rule, fallback). A tuple rule lists (min_value, health, reason) tiers,
+# highest first, and the first tier the value reaches wins; a dict rule maps exact
+# values to (health, reason). Otherwise the fallback (health, reason) applies.
+# Reasons are format strings with {val}.
+_CONFIG_HEALTH_RULES = (
+    ("thread_cache_size",
+     ((1, "healthy", "Thread caching enabled"),),
+     ("warning", "Thread caching disabled")),
+    ("wait_timeout",
+     ((300, "healthy", "≥ 300s ({val}s)"),
+      (60, "warning", "60-300s range ({val}s)")),
+     ("critical", "< 60s ({val}s)")),
+    ("innodb_log_file_size",
+     ((_MB_512, "healthy", "≥ 512MB"),
+      (_MB_128, "warning", "128-512MB range")),
+     ("critical", "< 128MB")),
+    ("innodb_flush_log_at_trx_commit",
+     {1: ("healthy", "Full ACID compliance"),
+      2: ("warning", "Flush to OS only (risk on crash)")},
+     ("critical", "No flush (data loss risk)")),
+    ("sync_binlog",
+     {1: ("healthy", "Sync after each transaction"),
+      0: ("warning", "No sync (OS-dependent)")},
+     ("healthy", "Sync every {val} transactions")),
+    ("innodb_read_io_threads",
+     ((4, "healthy", "{val} threads"),
+      (1, "warning", "Only {val} thread(s)")),
+     ("critical", "No read threads")),
+    ("innodb_write_io_threads",
+     ((4, "healthy", "{val} threads"),
+      (1, "warning", "Only {val} thread(s)")),
+     ("critical", "No write threads")),
+)
+
+
+def _int_or_default(value: Any, default: int = 0) -> int:
+    """int(value), or default if it cannot be converted."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+@lru_cache(maxsize=4096)
+def _fmt_msg(template: str, *args: Any) -> str:
+    """template.format(*args), memoized: hosts in a job tend to share the same settings."""
+    return template.format(*args)
+
+
+# ===== Health checks =====
+# Each check takes (ints, status, system_info) and returns (health, reason), or None
+# when there is not enough information to judge the variable. It is only called when
+# its variable is present in config_vars.
+
+def _health_innodb_buffer_pool_size(ints, status, system_info):
+    """Buffer pool size compared to RAM."""
+    pool_size = ints["innodb_buffer_pool_size"]
+    total_ram = _int_or_default(system_info.get("total_ram", 0))
+    
+    if total_ram > 0:
+        pct = (pool_size / total_ram) * 100
+        if pct > 60:
+            return "healthy", f"{pct:.0f}% of RAM"
+        if pct >= 30:
+            return "warning", f"{pct:.0f}% of RAM (30-60%)"
+        return "critical", f"Only {pct:.0f}% of RAM"
+    # No RAM info available, just show the value without indicator
+    return None, "System RAM unknown"
+
+
+def _health_max_connections(ints, status, system_info):
+    """max_connections compared to current usage."""
+    max_conn = ints["max_connections"]
+    current_conn = status.get("Threads_connected", 0)
+    
+    if max_conn <= 0:
+        return None
+    usage_pct = (current_conn / max_conn) * 100
+    if usage_pct > 95:
+        health = "critical"
+    elif usage_pct >= 80:
+        health = "warning"
+    else:
+        health = "healthy"
+    return health, f"{usage_pct:.0f}% used ({current_conn}/{max_conn})"
+
+
+def _health_tmp_table_size(ints, status, system_info):
+    tmp_size = ints["tmp_table_size"]
+    if tmp_size >= _MB_64:
+        return "healthy", "≥ 64MB"
+    if tmp_size >= _MB_16:
+        return "warning", "16-64MB range"
+    return "critical", "< 16MB"
+
+
+def _health_max_heap_table_size(ints, status, system_info):
+    """max_heap_table_size compared to tmp_table_size."""
+    heap_size = ints["max_heap_table_size"]
+    tmp_size = ints.get("tmp_table_size", 0)
+    
+    if tmp_size <= 0:
+        return None
+    if heap_size >= tmp_size:
+        return "healthy", "≥ tmp_table_size"
+    return "warning", "< tmp_table_size (limits temp tables)"
+
+
+def _health_table_open_cache(ints, status, system_info):
+    cache = ints["table_open_cache"]
+    open_tables = status.get("Open_tables", 0)
+    table_open_cache_overflows = status.get("Table_open_cache_overflows", 0)
+    
+    if table_open_cache_overflows > 0:
+        return "critical", _fmt_msg("{:,} overflows", table_open_cache_overflows)
+    if cache >= open_tables:
+        return "healthy", _fmt_msg("Cache ({:,}) ≥ Open ({:,})", cache, open_tables)
+    return "warning", _fmt_msg("Cache ({:,}) < Open ({:,})", cache, open_tables)
+
+
+def _health_table_definition_cache(ints, status, system_info):
+    cache = ints["table_definition_cache"]
+    open_defs = status.get("Open_table_definitions", 0)
+    
+    if open_defs <= 0:
+        return None
+    if cache >= open_defs:
+        return "healthy", _fmt_msg("Cache ({:,}) ≥ Open defs ({:,})", cache, open_defs)
+    return "warning", _fmt_msg("Cache ({:,}) < Open defs ({:,})", cache, open_defs)
+
+
+def _health_open_files_limit(ints, status, system_info):
+    limit = ints["open_files_limit"]
+    table_cache = ints.get("table_open_cache", 0)
+    
+    if table_cache <= 0:
+        return None
+    if limit >= table_cache * 2:
+        return "healthy", "≥ 2× table_open_cache"
+    return "warning", _fmt_msg("< 2× table_open_cache ({:,})", table_cache * 2)
+
+
+def _rule_check(var: str, rule: Any, fallback: Tuple[str, str]):
+    """Build a health check from a _CONFIG_HEALTH_RULES entry."""
+    if isinstance(rule, dict):
+        def check(ints, status, system_info):
+            val = ints[var]
+            health, reason = rule.get(val, fallback)
+            return health, reason.format(val=val)
+        return check
+    
+    # Tier ladder: ascending minimums, and the outcome for each bisect position
+    # (position 0 is below every tier, i.e. the fallback)
+    thresholds = tuple(min_val for min_val, _, _ in reversed(rule))
+    outcomes = (fallback,) + tuple((h, r) for _, h, r in reversed(rule))
+    
+    def check(ints, status, system_info):
+        val = ints[var]
+        health, reason = outcomes[bisect_right(thresholds, val)]
+        return health, reason.format(val=val)
+    return check
+
+
+# variable -> health check
+_CONFIG_HEALTH_HANDLERS = {
+    # Memory & Core Limits
+    "innodb_buffer_pool_size": _health_innodb_buffer_pool_size,
+    "max_connections": _health_max_connections,
+    "tmp_table_size": _health_tmp_table_size,
+    "max_heap_table_size": _health_max_heap_table_size,
+    # Table & Metadata Cache
+    "table_open_cache": _health_table_open_cache,
+    "table_definition_cache": _health_table_definition_cache,
+    "open_files_limit": _health_open_files_limit,
+    # Threading, Redo / Durability, I/O Threads
+    **{var: _rule_check(var, rule, fallback) for var, rule, fallback in _CONFIG_HEALTH_RULES},
+}
+
+
 def evaluate_config_health(
     config_vars: Dict[str, Any],
     global_status: Dict[str, Any],
@@ -669,209 +1103,29 @@ def evaluate_config_health(
         Dictionary of variable_name -> {value, health, reason}
         health is one of: 'healthy', 'warning', 'critical'
     """
-    result = {}
     system_info = system_info or {}
     
-    def get_int(d: dict, key: str, default: int = 0) -> int:
-        """Safely get integer value from dict."""
-        try:
-            return int(d.get(key, default))
-        except (ValueError, TypeError):
-            return default
-    
-    # Helper to add health entry
-    def add_health(var: str, health: str, reason: str):
-        if var in config_vars:
-            result[var] = {
-                "value": config_vars[var],
-                "health": health,
-                "reason": reason
-            }
-    
-    # ===== Memory & Core Limits =====
-    
-    # innodb_buffer_pool_size - compared to RAM
-    if "innodb_buffer_pool_size" in config_vars:
-        pool_size = get_int(config_vars, "innodb_buffer_pool_size")
-        total_ram = get_int(system_info, "total_ram", 0)
-        
-        if total_ram > 0:
-            pct = (pool_size / total_ram) * 100
-            if pct > 60:
-                add_health("innodb_buffer_pool_size", "healthy", f"{pct:.0f}% of RAM")
-            elif pct >= 30:
-                add_health("innodb_buffer_pool_size", "warning", f"{pct:.0f}% of RAM (30-60%)")
-            else:
-                add_health("innodb_buffer_pool_size", "critical", f"Only {pct:.0f}% of RAM")
-        else:
-            # No RAM info available, just show the value without indicator
-            result["innodb_buffer_pool_size"] = {
-                "value": config_vars["innodb_buffer_pool_size"],
-                "health": None,
-                "reason": "System RAM unknown"
-            }
-    
-    # max_connections - compared to current usage
-    if "max_connections" in config_vars:
-        max_conn = get_int(config_vars, "max_connections")
-        current_conn = get_int(global_status, "Threads_connected", 0)
-        
-        if max_conn > 0:
-            usage_pct = (current_conn / max_conn) * 100
-            if usage_pct > 95:
-                add_health("max_connections", "critical", f"{usage_pct:.0f}% used ({current_conn}/{max_conn})")
-            elif usage_pct >= 80:
-                add_health("max_connections", "warning", f"{usage_pct:.0f}% used ({current_conn}/{max_conn})")
-            else:
-                add_health("max_connections", "healthy", f"{usage_pct:.0f}% used ({current_conn}/{max_conn})")
-    
-    # tmp_table_size
-    if "tmp_table_size" in config_vars:
-        tmp_size = get_int(config_vars, "tmp_table_size")
-        mb_64 = 64 * 1024 * 1024
-        mb_16 = 16 * 1024 * 1024
-        
-        if tmp_size >= mb_64:
-            add_health("tmp_table_size", "healthy", "≥ 64MB")
-        elif tmp_size >= mb_16:
-            add_health("tmp_table_size", "warning", "16-64MB range")
-        else:
-            add_health("tmp_table_size", "critical", "< 16MB")
-    
-    # max_heap_table_size - compared to tmp_table_size
-    if "max_heap_table_size" in config_vars:
-        heap_size = get_int(config_vars, "max_heap_table_size")
-        tmp_size = get_int(config_vars, "tmp_table_size", 0)
-        
-        if tmp_size > 0:
-            if heap_size >= tmp_size:
-                add_health("max_heap_table_size", "healthy", "≥ tmp_table_size")
-            else:
-                add_health("max_heap_table_size", "warning", "< tmp_table_size (limits temp tables)")
-    
-    # ===== Table & Metadata Cache =====
+    # Convert the numeric inputs once up front; missing or non-numeric values read as 0
+    ints = {k: _int_or_default(config_vars[k]) for k in _HEALTH_CONFIG_INT_KEYS if k in config_vars}
+    status = {k: _int_or_default(global_status[k]) for k in _HEALTH_STATUS_INT_KEYS if k in global_status}
     
-    # table_open_cache
-    if "table_open_cache" in config_vars:
-        cache = get_int(config_vars, "table_open_cache")
-        open_tables = get_int(global_status, "Open_tables", 0)
-        opened_tables = get_int(global_status, "Opened_tables", 0)
-        table_open_cache_overflows = get_int(global_status, "Table_open_cache_overflows", 0)
-        
-        if table_open_cache_overflows > 0:
-            add_health("table_open_cache", "critical", f"{table_open_cache_overflows:,} overflows")
-        elif cache >= open_tables:
-            add_health("table_open_cache", "healthy", f"Cache ({cache:,}) ≥ Open ({open_tables:,})")
-        else:
-            add_health("table_open_cache", "warning", f"Cache ({cache:,}) < Open ({open_tables:,})")
-    
-    # table_definition_cache
-    if "table_definition_cache" in config_vars:
-        cache = get_int(config_vars, "table_definition_cache")
-        open_defs = get_int(global_status, "Open_table_definitions", 0)
-        
-        if open_defs > 0:
-            if cache >= open_defs:
-                add_health("table_definition_cache", "healthy", f"Cache ({cache:,}) ≥ Open defs ({open_defs:,})")
-            else:
-                add_health("table_definition_cache", "warning", f"Cache ({cache:,}) < Open defs ({open_defs:,})")
-    
-    # open_files_limit
-    if "open_files_limit" in config_vars:
-        limit = get_int(config_vars, "open_files_limit")
-        table_cache = get_int(config_vars, "table_open_cache", 0)
-        
-        if table_cache > 0:
-            if limit >= table_cache * 2:
-                add_health("open_files_limit", "healthy", f"≥ 2× table_open_cache")
-            else:
-                add_health("open_files_limit", "warning", f"< 2× table_open_cache ({table_cache * 2:,})")
-    
-    # ===== Threading =====
-    
-    # thread_cache_size
-    if "thread_cache_size" in config_vars:
-        cache = get_int(config_vars, "thread_cache_size")
-        if cache > 0:
-            add_health("thread_cache_size", "healthy", "Thread caching enabled")
-        else:
-            add_health("thread_cache_size", "warning", "Thread caching disabled")
-    
-    # wait_timeout
-    if "wait_timeout" in config_vars:
-        timeout = get_int(config_vars, "wait_timeout")
-        if timeout >= 300:
-            add_health("wait_timeout", "healthy", f"≥ 300s ({timeout}s)")
-        elif timeout >= 60:
-            add_health("wait_timeout", "warning", f"60-300s range ({timeout}s)")
-        else:
-            add_health("wait_timeout", "critical", f"< 60s ({timeout}s)")
-    
-    # ===== Redo / Durability =====
-    
-    # innodb_log_file_size
-    if "innodb_log_file_size" in config_vars:
-        size = get_int(config_vars, "innodb_log_file_size")
-        mb_512 = 512 * 1024 * 1024
-        mb_128 = 128 * 1024 * 1024
-        
-        if size >= mb_512:
-            add_health("innodb_log_file_size", "healthy", "≥ 512MB")
-        elif size >= mb_128:
-            add_health("innodb_log_file_size", "warning", "128-512MB range")
-        else:
-            add_health("innodb_log_file_size", "critical", "< 128MB")
-    
-    # innodb_flush_log_at_trx_commit
-    if "innodb_flush_log_at_trx_commit" in config_vars:
-        val = get_int(config_vars, "innodb_flush_log_at_trx_commit")
-        if val == 1:
-            add_health("innodb_flush_log_at_trx_commit", "healthy", "Full ACID compliance")
-        elif val == 2:
-            add_health("innodb_flush_log_at_trx_commit", "warning", "Flush to OS only (risk on crash)")
-        else:
-            add_health("innodb_flush_log_at_trx_commit", "critical", "No flush (data loss risk)")
-    
-    # sync_binlog
-    if "sync_binlog" in config_vars:
-        val = get_int(config_vars, "sync_binlog")
-        if val == 1:
-            add_health("sync_binlog", "healthy", "Sync after each transaction")
-        elif val == 0:
-            add_health("sync_binlog", "warning", "No sync (OS-dependent)")
-        else:
-            add_health("sync_binlog", "healthy", f"Sync every {val} transactions")
-    
-    # ===== I/O Threads =====
+    # Only variables that are both collected and have a check get dispatched
+    verdicts = [
+        (var, verdict)
+        for var in _CONFIG_HEALTH_HANDLERS.keys() & config_vars.keys()
+        if (verdict := _CONFIG_HEALTH_HANDLERS[var](ints, status, system_info)) is not None
+    ]
+    result = {
+        var: {"value": config_vars[var], "health": health, "reason": reason}
+        for var, (health, reason) in verdicts
+    }
     
-    # innodb_read_io_threads
-    if "innodb_read_io_threads" in config_vars:
-        val = get_int(config_vars, "innodb_read_io_threads")
-        if val >= 4:
-            add_health("innodb_read_io_threads", "healthy", f"{val} threads")
-        elif val > 0:
-            add_health("innodb_read_io_threads", "warning", f"Only {val} thread(s)")
-        else:
-            add_health("innodb_read_io_threads", "critical", "No read threads")
-    
-    # innodb_write_io_threads
-    if "innodb_write_io_threads" in config_vars:
-        val = get_int(config_vars, "innodb_write_io_threads")
-        if val >= 4:
-            add_health("innodb_write_io_threads", "healthy", f"{val} threads")
-        elif val > 0:
-            add_health("innodb_write_io_threads", "warning", f"Only {val} thread(s)")
-        else:
-            add_health("innodb_write_io_threads", "critical", "No write threads")
-    
-    # Add remaining important vars without health indicators
-    for var in CONFIG_VARIABLES_ALLOWLIST:
-        if var in config_vars and var not in result:
-            result[var] = {
-                "value": config_vars[var],
-                "health": None,
-                "reason": ""
-            }
+    # Add remaining important vars without health indicators (set operations pick
+    # them out; callers look entries up by name, so their order does not matter)
+    result.update({
+        var: {"value": config_vars[var], "health": None, "reason": ""}
+        for var in (CONFIG_VARIABLES_ALLOWLIST_SET & config_vars.keys()) - result.keys()
+    })
     
     return result
 
@@ -1251,8 +1505,7 @@ def parse_deadlock_info(raw_output: str) -> Dict[str, Any]:
     }
     
     # Handle literal \n in output
-    if '\\n' in raw_output:
-        raw_output = raw_output.replace('\\n', '\n')
+    raw_output = _unescape_newlines(raw_output)
     
     # Extract LATEST DETECTED DEADLOCK section
     deadlock_section = _extract_section(raw_output, "LATEST DETECTED DEADLOCK")
@@ -1275,7 +1528,7 @@ def parse_deadlock_info(raw_output: str) -> Dict[str, Any]:
     
     # Extract transactions involved in deadlock
     # Pattern: *** (1) TRANSACTION: or *** (2) TRANSACTION:
-    trx_blocks = re.split(r'\*\*\* \(\d+\) TRANSACTION:', deadlock_section)
+    trx_blocks = _RE_DEADLOCK_TRX_SPLIT.split(deadlock_section)
     
     for i, block in enumerate(trx_blocks[1:], 1):  # Skip first empty split
         trx_info = {
@@ -1335,11 +1588,7 @@ def parse_deadlock_info(raw_output: str) -> Dict[str, Any]:
         # Extract the actual SQL query (starts with INSERT/UPDATE/DELETE/SELECT/REPLACE)
         # The query appears after the "MySQL thread id ... user state" line
         # Match from the SQL keyword to end of block or next section marker
-        query_match = re.search(
-            r"(?:^|\n)((?:INSERT|UPDATE|DELETE|SELECT|REPLACE)\s+(?:INTO\s+)?[`\w].*?)(?:\n\*\*\*|\nRECORD LOCKS|\n---|\n$|$)", 
-            block, 
-            re.IGNORECASE | re.DOTALL
-        )
+        query_match = _RE_DEADLOCK_QUERY.search(block)
         if query_match:
             query = query_match.group(1).strip()
             # Clean up any trailing whitespace/newlines
@@ -1355,7 +1604,7 @@ def parse_deadlock_info(raw_output: str) -> Dict[str, Any]:
             trx_info["table"] = f"{table_match.group(1)}.{table_match.group(2)}"
         elif not trx_info["table"] and trx_info["query"]:
             # Try to extract table from query
-            query_table = re.search(r"(?:INTO|FROM|UPDATE)\s+(\w+)", trx_info["query"], re.IGNORECASE)
+            query_table = _RE_QUERY_TABLE.search(trx_info["query"])
             if query_table:
                 trx_info["table"] = query_table.group(1)
         
@@ -1376,14 +1625,14 @@ def parse_deadlock_info(raw_output: str) -> Dict[str, Any]:
             trx_info["operation"] = "SELECT"
         
         # Extract lock mode
-        lock_match = re.search(r"(RECORD LOCKS|GAP|X|S) lock", block, re.IGNORECASE)
+        lock_match = _RE_LOCK_MODE.search(block)
         if lock_match:
             trx_info["lock_mode"] = lock_match.group(1).upper()
         
         result["transactions"].append(trx_info)
     
     # Find the rolled back transaction (victim)
-    victim_match = re.search(r"WE ROLL BACK TRANSACTION \((\d+)\)", deadlock_section)
+    victim_match = _RE_ROLLBACK_VICTIM.search(deadlock_section)
     if victim_match:
         victim_num = int(victim_match.group(1))
         result["victim_trx_id"] = result["transactions"][victim_num - 1]["trx_id"] if victim_num <= len(result["transactions"]) else None
@@ -1414,8 +1663,7 @@ def parse_lock_contention(raw_output: str) -> Dict[str, Any]:
     }
     
     # Handle literal \n in output
-    if '\\n' in raw_output:
-        raw_output = raw_output.replace('\\n', '\n')
+    raw_output = _unescape_newlines(raw_output)
     
     # Extract TRANSACTIONS section
     trx_section = _extract_section(raw_output, "TRANSACTIONS")
@@ -1447,7 +1695,7 @@ def parse_lock_contention(raw_output: str) -> Dict[str, Any]:
             detail = {"trx_id": None, "wait_seconds": 0, "table": None, "index": None}
             
             # Extract transaction ID (first number after split point)
-            trx_match = re.match(r"\s*(\d+)", block)
+            trx_match = _RE_LEADING_NUMBER.match(block)
             if trx_match:
                 detail["trx_id"] = trx_match.group(1)
             
@@ -1493,8 +1741,7 @@ def parse_hot_indexes(raw_output: str) -> Dict[str, Any]:
     }
     
     # Handle literal \n in output
-    if '\\n' in raw_output:
-        raw_output = raw_output.replace('\\n', '\n')
+    raw_output = _unescape_newlines(raw_output)
     
     # Track index contention
     index_stats = {}  # key: "table.index" -> {"count": N, "lock_types": set()}
@@ -1511,10 +1758,10 @@ def parse_hot_indexes(raw_output: str) -> Dict[str, Any]:
     
     # Convert to list and sort by contention count
     for key, stats in index_stats.items():
-        parts = key.split(".", 1)
+        table, sep, index = key.partition(".")
         result["hot_indexes"].append({
-            "table": parts[0] if len(parts) > 1 else "unknown",
-            "index": parts[-1],
+            "table": table if sep else "unknown",
+            "index": index if sep else table,
             "contention_count": stats["count"],
             "lock_types": list(stats["lock_types"]),
         })
@@ -1595,8 +1842,7 @@ def parse_semaphore_health(raw_output: str) -> Dict[str, Any]:
     }
     
     # Handle literal \n in output
-    if '\\n' in raw_output:
-        raw_output = raw_output.replace('\\n', '\n')
+    raw_output = _unescape_newlines(raw_output)
     
     # Extract SEMAPHORES section
     sem_section = _extract_section(raw_output, "SEMAPHORES")
@@ -1604,17 +1850,17 @@ def parse_semaphore_health(raw_output: str) -> Dict[str, Any]:
         return result
     
     # Parse RW-shared
-    rw_shared = re.search(r"RW-shared spins (\d+), rounds (\d+), OS waits (\d+)", sem_section)
+    rw_shared = _RE_RW_SHARED.search(sem_section)
     if rw_shared:
         result["rw_shared_os_waits"] = int(rw_shared.group(3))
     
     # Parse RW-excl
-    rw_excl = re.search(r"RW-excl spins (\d+), rounds (\d+), OS waits (\d+)", sem_section)
+    rw_excl = _RE_RW_EXCL.search(sem_section)
     if rw_excl:
         result["rw_excl_os_waits"] = int(rw_excl.group(3))
     
     # Parse RW-sx
-    rw_sx = re.search(r"RW-sx spins (\d+), rounds (\d+), OS waits (\d+)", sem_section)
+    rw_sx = _RE_RW_SX.search(sem_section)
     if rw_sx:
         result["rw_sx_os_waits"] = int(rw_sx.group(3))
     
@@ -1629,7 +1875,7 @@ def parse_semaphore_health(raw_output: str) -> Dict[str, Any]:
     result["has_mutex_contention"] = result["total_os_waits"] > 0
     
     # Parse spin rounds per wait
-    spin_match = re.search(r"Spin rounds per wait: ([\d.]+) RW-shared, ([\d.]+) RW-excl, ([\d.]+) RW-sx", sem_section)
+    spin_match = _RE_SPIN_ROUNDS.search(sem_section)
     if spin_match:
         result["spin_rounds_per_wait"] = {
             "rw_shared": float(spin_match.group(1)),
@@ -1672,23 +1918,22 @@ def parse_redo_log_health(raw_output: str, previous_checkpoint_age: Optional[int
     }
     
     # Handle literal \n in output
-    if '\\n' in raw_output:
-        raw_output = raw_output.replace('\\n', '\n')
+    raw_output = _unescape_newlines(raw_output)
     
     # Extract LOG section
     log_section = _extract_section(raw_output, "LOG")
     if not log_section:
         return result
     
+    log = _first_matches(_RE_LOG, log_section)
+    
     # Parse log sequence number
-    lsn_match = re.search(r"Log sequence number\s+(\d+)", log_section)
-    if lsn_match:
-        result["log_sequence_number"] = int(lsn_match.group(1))
+    if "log_sequence_number" in log:
+        result["log_sequence_number"] = int(log["log_sequence_number"][0])
     
     # Parse last checkpoint
-    checkpoint_match = re.search(r"Last checkpoint at\s+(\d+)", log_section)
-    if checkpoint_match:
-        result["last_checkpoint"] = int(checkpoint_match.group(1))
+    if "last_checkpoint" in log:
+        result["last_checkpoint"] = int(log["last_checkpoint"][0])
     
     # Calculate checkpoint age
     if result["log_sequence_number"] and result["last_checkpoint"]:
@@ -1696,13 +1941,11 @@ def parse_redo_log_health(raw_output: str, previous_checkpoint_age: Optional[int
         result["checkpoint_age_mb"] = round(result["checkpoint_age_bytes"] / (1024 * 1024), 2)
     
     # Parse log I/O
-    log_io_match = re.search(r"(\d+) log i/o's done", log_section)
-    if log_io_match:
-        result["log_ios_done"] = int(log_io_match.group(1))
+    if "log_ios_done" in log:
+        result["log_ios_done"] = int(log["log_ios_done"][0])
     
-    log_io_rate = re.search(r"([\d.]+) log i/o's/second", log_section)
-    if log_io_rate:
-        result["log_ios_per_sec"] = float(log_io_rate.group(1))
+    if "log_ios_per_sec" in log:
+        result["log_ios_per_sec"] = float(log["log_ios_per_sec"][0])
     
     # Determine trend (if previous data available)
     if previous_checkpoint_age is not None:
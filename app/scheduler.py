@@ -1,16 +1,17 @@
 """Background scheduler for cron job execution."""
 
-import json
 import logging
 import threading
 import time
-import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
+import orjson
+
 from .db import get_db_context
 from .models import CronJob, Job, JobHost, JobStatus, HostJobStatus
-from .collector import run_collection_job
+from .collector import start_collection_job
+from .utils import generate_job_id, generate_job_host_id
 
 logger = logging.getLogger(__name__)
 
@@ -96,10 +97,10 @@ class CronScheduler:
                 
                 try:
                     # Parse host IDs
-                    host_ids = json.loads(cron.host_ids)
+                    host_ids = orjson.loads(cron.host_ids)
                     
                     # Create a new collection job
-                    job_id = str(uuid.uuid4())
+                    job_id = generate_job_id()
                     job_name = f"[Cron] {cron.name}"
                     
                     new_job = Job(
@@ -111,7 +112,7 @@ class CronScheduler:
                     
                     for host_id in host_ids:
                         job_host = JobHost(
-                            id=str(uuid.uuid4()),
+                            id=generate_job_host_id(),
                             job_id=job_id,
                             host_id=host_id,
                             status=HostJobStatus.pending
@@ -126,13 +127,8 @@ class CronScheduler:
                     
                     db.commit()
                     
-                    # Run collection in background thread
-                    collect_hot_tables = cron.collect_hot_tables
-                    threading.Thread(
-                        target=run_collection_job,
-                        args=(job_id, host_ids, collect_hot_tables),
-                        daemon=True
-                    ).start()
+                    # Run collection in the background
+                    start_collection_job(job_id, host_ids, cron.collect_hot_tables)
                     
                     logger.info(f"Cron '{cron.name}' started job {job_id[:8]}, next run at {cron.next_run_at}")
                     
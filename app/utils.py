@@ -1,19 +1,29 @@
 """Utility functions for the application."""
 
 import os
+import time
 import uuid
 import yaml
+import orjson
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Tuple
+from dataclasses import dataclass, fields
+
+try:
+    # libyaml-backed loader, available when PyYAML was built with libyaml
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
 
 logger = logging.getLogger("masc.utils")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HostConfig:
-    """Host configuration data class."""
+    """Host configuration data class (immutable: cached lists are shared between callers)."""
     id: str
     label: str
     host: str
@@ -25,6 +35,9 @@ class HostConfig:
     group_id: Optional[str] = None
 
 
+_HOST_CONFIG_FIELDS = frozenset(f.name for f in fields(HostConfig))
+
+
 # Project paths - use current working directory for data files
 # This allows the package to work when installed via pip
 # Users run the tool from their project directory where hosts.yaml and runs/ live
@@ -46,40 +59,86 @@ if _hosts_file_env:
 else:
     HOSTS_FILE = CWD / "hosts.yaml"
 
+# Collection concurrency (the collector's worker pools; the DB pool is sized from these)
+# Hosts collected concurrently, across all running jobs
+MAX_PARALLEL_HOSTS = 10
+# Jobs running at once; further jobs wait (status pending) for a free slot
+MAX_CONCURRENT_JOBS = 4
+
+
+# Cached load_hosts() results: include_disabled -> (expires_at, hosts.yaml key, hosts, hosts by id),
+# where the key is _hosts_file_key(). Host/group routes call invalidate_hosts_cache();
+# the TTL covers edits made outside the app.
+_HOSTS_CACHE: Dict[bool, Tuple[float, Optional[Tuple[int, int]], List[HostConfig], Dict[str, HostConfig]]] = {}
+_HOSTS_CACHE_TTL = 30.0
+_HOSTS_CACHE_LOCK = threading.Lock()
+# Bumped by invalidate_hosts_cache(); a load that started before an invalidation
+# is returned to its caller but not cached, so it cannot outlive the edit
+_HOSTS_CACHE_GENERATION = 0
+
+# Parsed hosts.yaml: ((mtime_ns, size), hosts). Reparsed only when the file changes.
+_HOSTS_YAML_CACHE: Optional[Tuple[Tuple[int, int], List[HostConfig]]] = None
+
+# Job and (job_id, host_id) output directories already created by ensure_job_dir()
+# and ensure_output_dir(). The app never deletes run directories, so a created
+# directory stays valid.
+_ENSURED_JOB_DIRS: Set[str] = set()
+_ENSURED_OUTPUT_DIRS: Set[Tuple[str, str]] = set()
+_ENSURED_OUTPUT_DIRS_LOCK = threading.Lock()
+
+# Serialized /api/jobs/{job_id}/status bodies: job_id -> (expires_at, body).
+# The job runner calls invalidate_job_status() whenever it commits a status change.
+_JOB_STATUS_CACHE: Dict[str, Tuple[float, bytes]] = {}
+_JOB_STATUS_CACHE_TTL = 1.0
+_JOB_STATUS_CACHE_MAX = 1024
+_JOB_STATUS_CACHE_LOCK = threading.Lock()
+
 
 def generate_job_id() -> str:
-    """Generate a unique job ID."""
-    return str(uuid.uuid4())
+    """Generate a unique job ID (a random UUID as 32 hex digits, without hyphens)."""
+    return uuid.uuid4().hex
 
 
 def generate_job_host_id() -> str:
-    """Generate a unique job-host ID."""
-    return str(uuid.uuid4())
+    """Generate a unique job-host ID (a random UUID as 32 hex digits, without hyphens)."""
+    return uuid.uuid4().hex
 
 
-def _load_hosts_from_yaml() -> List[HostConfig]:
-    """Load hosts from YAML file (legacy support)."""
-    if not HOSTS_FILE.exists():
+def _load_hosts_from_yaml(key: Optional[Tuple[int, int]]) -> List[HostConfig]:
+    """
+    Load hosts from YAML file (legacy support), cached by the file's mtime and size.
+    
+    key is the caller's _hosts_file_key() result, so the file is stat'ed once per load.
+    """
+    global _HOSTS_YAML_CACHE
+    if key is None:
         return []
     
+    cached = _HOSTS_YAML_CACHE
+    if cached and cached[0] == key:
+        return list(cached[1])
+    
+    try:
+        hosts = _parse_hosts_yaml()
+    except FileNotFoundError:
+        # Removed since it was stat'ed
+        return []
+    with _HOSTS_CACHE_LOCK:
+        _HOSTS_YAML_CACHE = (key, hosts)
+    return list(hosts)
+
+
+def _parse_hosts_yaml() -> List[HostConfig]:
+    """Parse hosts.yaml into HostConfig objects."""
     logger.debug(f"Loading hosts from YAML: {HOSTS_FILE}")
-    with open(HOSTS_FILE, "r") as f:
-        data = yaml.safe_load(f)
-    
-    hosts = []
-    for h in data.get("hosts", []):
-        hosts.append(HostConfig(
-            id=h["id"],
-            label=h["label"],
-            host=h["host"],
-            port=h["port"],
-            user=h["user"],
-            password=h["password"],
-            enabled=h.get("enabled", True),
-            notes=h.get("notes"),
-            group_id=h.get("group_id"),
-        ))
-    return hosts
+    with open(HOSTS_FILE, "rb") as f:
+        data = yaml.load(f, Loader=_YamlSafeLoader)
+    
+    # Unknown keys in an entry are ignored; missing optional ones take the field defaults
+    return [
+        HostConfig(**{k: v for k, v in h.items() if k in _HOST_CONFIG_FIELDS})
+        for h in data.get("hosts", ())
+    ]
 
 
 def _load_hosts_from_db() -> List[HostConfig]:
@@ -108,6 +167,24 @@ def _load_hosts_from_db() -> List[HostConfig]:
         return []
 
 
+def _hosts_file_key() -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of hosts.yaml from a single stat, or None if it does not exist."""
+    try:
+        st = os.stat(HOSTS_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def invalidate_hosts_cache() -> None:
+    """Drop cached host lists (call after creating, updating or deleting hosts/groups)."""
+    global _HOSTS_YAML_CACHE, _HOSTS_CACHE_GENERATION
+    with _HOSTS_CACHE_LOCK:
+        _HOSTS_CACHE_GENERATION += 1
+        _HOSTS_CACHE.clear()
+        _HOSTS_YAML_CACHE = None
+
+
 def load_hosts(include_disabled: bool = False) -> List[HostConfig]:
     """
     Load hosts from database, falling back to YAML if DB is empty.
@@ -117,9 +194,37 @@ def load_hosts(include_disabled: bool = False) -> List[HostConfig]:
     2. If DB is empty but YAML exists -> import YAML to DB, then use DB
     3. If both empty -> return empty list
     
+    Results are cached until invalidate_hosts_cache() is called, hosts.yaml
+    changes, or the cache TTL expires.
+    
     Args:
         include_disabled: If True, include disabled hosts in the result
     """
+    return list(_cached_hosts(include_disabled)[0])
+
+
+def _cached_hosts(include_disabled: bool) -> Tuple[List[HostConfig], Dict[str, HostConfig]]:
+    """Return the cached (hosts, hosts by id) pair, reloading it if stale."""
+    yaml_key = _hosts_file_key()
+    cached = _HOSTS_CACHE.get(include_disabled)
+    if cached and cached[0] > time.monotonic() and cached[1] == yaml_key:
+        return cached[2], cached[3]
+    
+    generation = _HOSTS_CACHE_GENERATION
+    hosts = _load_hosts_uncached(include_disabled, yaml_key)
+    by_id = {h.id: h for h in hosts}
+    with _HOSTS_CACHE_LOCK:
+        if generation == _HOSTS_CACHE_GENERATION:
+            _HOSTS_CACHE[include_disabled] = (time.monotonic() + _HOSTS_CACHE_TTL, yaml_key, hosts, by_id)
+    return hosts, by_id
+
+
+def _load_hosts_uncached(include_disabled: bool, yaml_key: Optional[Tuple[int, int]]) -> List[HostConfig]:
+    """
+    Load hosts from the database (migrating from YAML if needed), bypassing the cache.
+    
+    yaml_key is the hosts.yaml _hosts_file_key() the caller already took.
+    """
     try:
         from .db import get_db_context
         from .models import DBHost
@@ -150,7 +255,7 @@ def load_hosts(include_disabled: bool = False) -> List[HostConfig]:
                 return hosts
             
             # DB is empty - check YAML for migration
-            yaml_hosts = _load_hosts_from_yaml()
+            yaml_hosts = _load_hosts_from_yaml(yaml_key)
             if yaml_hosts:
                 logger.info(f"Migrating {len(yaml_hosts)} hosts from YAML to database...")
                 for h in yaml_hosts:
@@ -177,7 +282,7 @@ def load_hosts(include_disabled: bool = False) -> List[HostConfig]:
             return []
     except Exception as e:
         logger.warning(f"Error loading hosts from DB, falling back to YAML: {e}")
-        yaml_hosts = _load_hosts_from_yaml()
+        yaml_hosts = _load_hosts_from_yaml(yaml_key)
         if include_disabled:
             return yaml_hosts
         return [h for h in yaml_hosts if h.enabled]
@@ -188,45 +293,177 @@ def load_all_hosts() -> List[HostConfig]:
     return load_hosts(include_disabled=True)
 
 
+def load_hosts_by_id(include_disabled: bool = False) -> Dict[str, HostConfig]:
+    """
+    Hosts keyed by id, as load_hosts() would return them.
+    
+    This is the cached index itself, shared between callers; treat it as read-only.
+    """
+    return _cached_hosts(include_disabled)[1]
+
+
 def get_host_by_id(host_id: str) -> Optional[HostConfig]:
-    """Get a specific host by ID (including disabled hosts)."""
-    hosts = load_hosts(include_disabled=True)
-    for h in hosts:
-        if h.id == host_id:
-            return h
+    """
+    Get a specific host by ID (including disabled hosts).
+    
+    Unknown ids are answered from the same cached index (a dict miss), so polling
+    with a stale id triggers no reload, and a newly added host is found as soon as
+    the cache is invalidated.
+    
+    Each call revalidates the host cache; when resolving many ids, look them up
+    in one load_hosts_by_id(include_disabled=True) snapshot instead.
+    """
+    return load_hosts_by_id(include_disabled=True).get(host_id)
+
+
+def get_cached_job_status(job_id: str) -> Optional[bytes]:
+    """Return the cached status body for a job, or None if missing or expired."""
+    cached = _JOB_STATUS_CACHE.get(job_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
     return None
 
 
+def cache_job_status(job_id: str, body: bytes) -> None:
+    """Cache a serialized status body for a job for a short TTL."""
+    now = time.monotonic()
+    with _JOB_STATUS_CACHE_LOCK:
+        if len(_JOB_STATUS_CACHE) >= _JOB_STATUS_CACHE_MAX:
+            for key in [k for k, (expires_at, _) in _JOB_STATUS_CACHE.items() if expires_at <= now]:
+                del _JOB_STATUS_CACHE[key]
+            if len(_JOB_STATUS_CACHE) >= _JOB_STATUS_CACHE_MAX:
+                _JOB_STATUS_CACHE.clear()
+        _JOB_STATUS_CACHE[job_id] = (now + _JOB_STATUS_CACHE_TTL, body)
+
+
+def invalidate_job_status(job_id: str) -> None:
+    """Drop the cached status body for a job (call after committing a status change)."""
+    with _JOB_STATUS_CACHE_LOCK:
+        _JOB_STATUS_CACHE.pop(job_id, None)
+
+
+# Job/host output locations never move, and Path objects are immutable, so
+# the joined paths are memoized and shared across handlers.
+@lru_cache(maxsize=1024)
 def get_job_dir(job_id: str) -> Path:
     """Get the directory path for a job."""
     return RUNS_DIR / f"job_{job_id}"
 
 
+@lru_cache(maxsize=4096)
 def get_host_output_dir(job_id: str, host_id: str) -> Path:
     """Get the directory path for a host's output within a job."""
     return get_job_dir(job_id) / host_id
 
 
+def ensure_job_dir(job_id: str) -> Path:
+    """Ensure a job's directory exists and return its path (mkdir runs once per process)."""
+    job_dir = get_job_dir(job_id)
+    if job_id in _ENSURED_JOB_DIRS:
+        return job_dir
+    job_dir.mkdir(parents=True, exist_ok=True)
+    with _ENSURED_OUTPUT_DIRS_LOCK:
+        _ENSURED_JOB_DIRS.add(job_id)
+    return job_dir
+
+
 def ensure_output_dir(job_id: str, host_id: str) -> Path:
-    """Ensure the output directory exists and return its path."""
+    """Ensure the output directory exists and return its path (mkdir runs once per process)."""
     output_dir = get_host_output_dir(job_id, host_id)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if (job_id, host_id) in _ENSURED_OUTPUT_DIRS:
+        return output_dir
+    # The job directory is created once; each host only adds its own leaf
+    ensure_job_dir(job_id)
+    output_dir.mkdir(exist_ok=True)
+    with _ENSURED_OUTPUT_DIRS_LOCK:
+        _ENSURED_OUTPUT_DIRS.add((job_id, host_id))
     return output_dir
 
 
+def scan_output_dir(output_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each file in a host output directory to its (mtime_ns, size).
+    
+    One directory scan replaces an exists()/stat() per artifact, and the
+    versions feed the artifact caches' keys.
+    """
+    files: Dict[str, Tuple[int, int]] = {}
+    try:
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    files[entry.name] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    return files
+
+
+def _read_bytes(path) -> bytes:
+    """Read a whole file with one os.read in the common case (no file object)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) != size:
+            # Short read, or the file grew since fstat: read the rest
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 1 << 20)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
 def read_file_safe(file_path: Path) -> Optional[str]:
-    """Safely read a file, returning None if it doesn't exist."""
-    if file_path.exists():
-        with open(file_path, "r") as f:
-            return f.read()
-    return None
+    """
+    Safely read a file, returning None if it doesn't exist.
+    
+    Reads bytes and decodes them in one call rather than going through a text
+    stream; our outputs are written as UTF-8 and are almost entirely ASCII.
+    Line endings are normalized to \\n as text mode would.
+    """
+    try:
+        data = _read_bytes(file_path)
+    except FileNotFoundError:
+        return None
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def read_json_safe(file_path: Path) -> Optional[Any]:
-    """Safely read a JSON file, returning None if it doesn't exist."""
-    import json
-    if file_path.exists():
-        with open(file_path, "r") as f:
-            return json.load(f)
-    return None
+    """
+    Safely read a JSON file, returning None if it doesn't exist.
+    
+    Parsed results are cached by (path, mtime, size) and shared between
+    callers, so treat them as read-only.
+    """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    return _load_json_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+def read_json_cached(file_path: Path, version: Optional[Tuple[int, int]]) -> Optional[Any]:
+    """
+    Like read_json_safe, for callers that already know the file's (mtime_ns, size).
+    
+    A version of None means the file does not exist.
+    """
+    if version is None:
+        return None
+    return _load_json_cached(str(file_path), *version)
+
+
+@lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON artifact; the stat fields only key the cache (artifacts are write-once)."""
+    return orjson.loads(_read_bytes(path))
 